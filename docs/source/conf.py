@@ -1,7 +1,9 @@
 import os
+import re
 import ast
 import sys
 import json
+import functools
 import pathlib
 import subprocess
 import datetime
@@ -22,6 +24,12 @@ DUCK_INIT_PATH = (
     pathlib.Path(__file__).resolve().parent / DUCK_PACKAGE_RELATIVE_PATH / "__init__.py"
 )
 
+# Name of the file storing the source fingerprint of the last autodocx run
+AUTODOCX_CACHE_FILENAME = ".autodocx_cache.json"
+
+# Matches metadata assignments like: __version__ = "1.0.0"
+METADATA_PATTERN = re.compile(r"^__[A-Za-z_]+__\s*=")
+
 # This must be called before any use of the duck.settings module e.g. through duck.app
 os.environ["DUCK_SETTINGS_MODULE"] = "duck.etc.structures.projects.testing.web.settings"
 os.environ["DJANGO_SETTINGS_MODULE"] = "duck.etc.structures.projects.testing.web.backend.django.duckapp.duckapp.settings"
@@ -32,10 +40,128 @@ def setup(app):
     def on_html_page_context(app, template_name, template, context, _):
         context["DUCK_HOMEPAGE"] = DUCK_HOMEPAGE
         context["DUCK_DOCS_URL"] = DUCK_DOCS_URL
-    app.connect("html-page-context", on_html_page_context)
+        
+        if "versions" in context:
+            # Set by sphinx-multiversion, consumed by the version picker
+            context["version_list"] = prepare_versions(context["versions"])
+            
+    # Run after sphinx-multiversion has added `versions` to the page context
+    app.connect("html-page-context", on_html_page_context, priority=600)
+    
+    # Run before and after autodocx generates the API docs
+    app.connect("builder-inited", on_builder_inited, priority=400)
+    app.connect("builder-inited", restore_autodocx_packages, priority=600)
     app.connect("build-finished", on_build_finished)
     
 
+def prepare_versions(versions) -> tuple[dict, ...]:
+    """
+    Prepares the version picker entries for a page.
+
+    Args:
+        versions: The sphinx-multiversion versions for the current page.
+
+    Returns:
+        tuple[dict, ...]: Entries with the version `name` and `url`, the `main` branch is shown as `latest`.
+    """
+    # Version URLs are relative to the current page, so they form part of the cache key.
+    return build_version_list(tuple((version.name, version.url) for version in versions))
+
+
+@functools.lru_cache(maxsize=None)
+def build_version_list(versions: tuple[tuple[str, str], ...]) -> tuple[dict, ...]:
+    """
+    Builds the version picker entries, cached for pages sharing the same version URLs.
+
+    The entries are shared between pages, so they are returned as a tuple and must be
+    treated as read-only. Plain dicts are kept as they are serialized with `tojson`.
+
+    Args:
+        versions (tuple): Pairs of version name and URL.
+
+    Returns:
+        tuple[dict, ...]: Entries with the version `name` and `url`.
+    """
+    return tuple(
+        {"name": "latest" if name == "main" else name, "url": url}
+        for name, url in versions
+    )
+
+
+def on_builder_inited(app):
+    """
+    Called when the Sphinx builder is initialized, before autodocx runs.
+
+    Skips API docs generation if the package sources and autodocx configuration are
+    unchanged since the last successful build and the generated docs are still present.
+
+    Args:
+        app: The Sphinx application object.
+    """
+    output_dir = pathlib.Path(app.srcdir) / app.config.autodocx_output_dir
+    cache_path = output_dir / AUTODOCX_CACHE_FILENAME
+    fingerprint = get_autodocx_fingerprint(app)
+    
+    # Keep the fingerprint so that it's saved once the build succeeds
+    app.autodocx_fingerprint = fingerprint
+    
+    try:
+        cached_fingerprint = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return
+    
+    if cached_fingerprint == fingerprint:
+        # Sources unchanged, reuse the previously generated API docs
+        app.autodocx_skipped_packages = app.config.autodocx_packages
+        app.config.autodocx_packages = []
+        
+
+def restore_autodocx_packages(app):
+    """
+    Restores the autodocx packages skipped by `on_builder_inited` once autodocx has run.
+
+    The config is saved along with the Sphinx environment, leaving it emptied would make
+    the next build see a config change and re-read every document.
+
+    Args:
+        app: The Sphinx application object.
+    """
+    skipped_packages = getattr(app, "autodocx_skipped_packages", None)
+    
+    if skipped_packages is not None:
+        app.config.autodocx_packages = skipped_packages
+        
+
+
+def get_autodocx_fingerprint(app) -> dict:
+    """
+    Computes a fingerprint of the autodocx packages sources and configuration.
+
+    Args:
+        app: The Sphinx application object.
+
+    Returns:
+        dict: Mapping of the autodocx configuration and each source file to its `[mtime_ns, size]`.
+    """
+    fingerprint = {
+        "config": repr([
+            app.config[name]
+            for name in sorted(app.config.values)
+            if name.startswith("autodocx_")
+        ]),
+    }
+    
+    for package in app.config.autodocx_packages:
+        package_dir = pathlib.Path(app.confdir) / package
+        
+        for root, _, filenames in os.walk(package_dir):
+            for filename in filenames:
+                if filename.endswith(".py"):
+                    stat = os.stat(os.path.join(root, filename))
+                    fingerprint[os.path.join(root, filename)] = [stat.st_mtime_ns, stat.st_size]
+    return fingerprint
+    
+
 def on_build_finished(app, exception):
     """
     Called when Sphinx finishes building the documentation.
@@ -45,6 +171,52 @@ def on_build_finished(app, exception):
         exception: Exception raised during build, if any.
     """
     generate_sitemap(app.outdir)
+    
+    fingerprint = getattr(app, "autodocx_fingerprint", None)
+    output_dir = pathlib.Path(app.srcdir) / app.config.autodocx_output_dir
+    
+    if exception is None and fingerprint and output_dir.is_dir():
+        # Record the sources the API docs were generated from
+        cache_path = output_dir / AUTODOCX_CACHE_FILENAME
+        cache_path.write_text(json.dumps(fingerprint), encoding="utf-8")
+
+
+@functools.lru_cache(maxsize=None)
+def parse_metadata(init_path: str, mtime_ns: int) -> dict:
+    """
+    Parses metadata variables from a package's __init__.py file.
+
+    The result is cached on the file path and modification time, so the file is
+    only parsed again when it changes.
+
+    Args:
+        init_path (str): The file path of the package's __init__.py file.
+        mtime_ns (int): The file modification time in nanoseconds, used as part of the cache key.
+
+    Returns:
+        dict: A dictionary mapping metadata names (e.g. __version__) to their string values.
+    """
+    metadata = {}
+    
+    # Read the whole file in one shot
+    text = pathlib.Path(init_path).read_text(encoding="utf-8")
+    
+    for line in text.splitlines():
+        # Look for __<name>__ = '<value>'
+        if not METADATA_PATTERN.match(line):
+            continue
+        
+        key, _, value = line.partition("=")
+        
+        try:
+            # Only literal values are evaluated, e.g. `__version__ = version` is skipped
+            value = ast.literal_eval(value.strip())
+        except (ValueError, SyntaxError):
+            continue
+        
+        if isinstance(value, str):
+            metadata[key.strip()] = value
+    return metadata
 
 
 def read_metadata_from_init(init_path):
@@ -58,22 +230,8 @@ def read_metadata_from_init(init_path):
     Returns:
         dict: A dictionary containing metadata like __version__, __author__, and __email__.
     """
-    metadata = {}
-    
-    with open(init_path, "r", encoding="utf-8") as f:
-        for line in f:
-            # Look for __<name>__ = '<value>'
-            if line.startswith("__") and "=" in line:
-                try:
-                    # Parse the line into an abstract syntax tree (AST) for safety
-                    node = ast.parse(line).body[0]
-                    if isinstance(node, ast.Assign):
-                        key = node.targets[0].id
-                        value = node.value.s  # Extract the string value
-                        metadata[key] = value
-                except Exception:
-                    pass  # Skip malformed lines
-    return metadata
+    init_path = str(init_path)
+    return dict(parse_metadata(init_path, os.stat(init_path).st_mtime_ns))
 
 
 def sitemap_sort_key(url: str) -> tuple[int, str]:
@@ -21,17 +21,16 @@ if __name__ == '__main__':
     app.run()
 ```
 """
+import os
 import sys
-import pathlib
 
-from duck.version import version
 from duck.compat import apply_backward_compatibility
 from duck.utils.threading.patch import patch_threading
 
 
 __author__ = "Brian Musakwa"
 __email__ = "digreatbrian@gmail.com"
-__version__ = version
+__version__ = "2.2.0"  # Single source of the package version, see `duck.version`
 
 
 # Patch threading module to add more functionality like getting parent threads
@@ -42,20 +41,21 @@ apply_backward_compatibility()
 
 # Add current directory or parent directory to pythonpath
 # This is critical for resolving modules inside the project.
-original_curdir = curdir = pathlib.Path(".").resolve()
-original_curdir = str(original_curdir)
+original_curdir = curdir = os.getcwd()
 curdir_endswith_web = False
 
-if curdir.parts[-1] == "web":
+if os.path.basename(curdir) == "web":
     # Maybe we are inside `web` directory e.g. someapp/web so 
     # lets add the basedir/parent instead
-    curdir = curdir.parent
+    curdir = os.path.dirname(curdir)
     curdir_endswith_web = True
 
-if curdir not in sys.path:
-    sys.path.insert(0, str(curdir))
+# Build the lookup set once rather than scanning sys.path for every check
+sys_paths = set(sys.path)
+
+if curdir not in sys_paths:
+    sys.path.insert(0, curdir)
     
-    if curdir_endswith_web and original_curdir not in sys.path:
+    if curdir_endswith_web and original_curdir not in sys_paths:
         # Also add the original directory as second to the stripped curdir
-        if original_curdir not in sys.path:
-            sys.path.insert(1, original_curdir)
+        sys.path.insert(1, original_curdir)
@@ -5,27 +5,21 @@ Main entry to Duck command-line tool.
 import os
 import sys
 import click
-import setproctitle
 
 from duck.art import duck_art_small
-from duck.version import server_version
-from duck.logging import console
-
-from duck.cli.commands.collectstatic import CollectStaticCommand
-from duck.cli.commands.makeproject import MakeProjectCommand
-from duck.cli.commands.makeblueprint import MakeBlueprintCommand
-from duck.cli.commands.django import DjangoCommand
-from duck.cli.commands.runserver import RunserverCommand
-from duck.cli.commands.runtests import RuntestsCommand
-from duck.cli.commands.ssl_gen import SSLGenCommand
-from duck.cli.commands.service import ServiceCommand
-from duck.cli.commands.integration import DjangoAddCommand
-from duck.cli.commands.logs import LogsCommand
-from duck.cli.commands.monitor import MonitorCommand
-from duck.cli.commands.sitemap import SitemapCommand
-
-
-EXAMPLES = f"""
+
+from duck.utils.importer import x_import
+
+
+def get_examples() -> str:
+    """
+    Returns the CLI usage examples shown when no subcommand is invoked.
+    
+    Built on demand so that the console colors module is only imported when needed.
+    """
+    from duck.logging import console
+    
+    return f"""
 Examples:
     python3 -m duck runserver -a 127.0.0.1 -p 8000
     python3 -m duck makeproject myproject -d ./projects
@@ -47,7 +41,77 @@ or with DUCK_SETTINGS_MODULE set: {console.Style.RESET_ALL}
    ...etc
 """
 
-@click.group(invoke_without_command=True)
+
+class LazySubcommandGroup(click.Group):
+    """
+    Click group whose subcommands are registered by a command class on first use.
+    
+    This keeps the command module (and everything it imports) out of the CLI startup
+    path until the group is actually listed or invoked.
+    """
+    
+    def __init__(self, *args, command_class_path: str, **kwargs):
+        """
+        Initialize the group.
+        
+        Args:
+            command_class_path (str): Import path to the command class providing `register_subcommands`.
+        """
+        super().__init__(*args, **kwargs)
+        self.command_class_path = command_class_path
+        self.subcommands_registered = False
+        
+    def register_subcommands(self):
+        """
+        Register the subcommands from the command class (only once).
+        """
+        if not self.subcommands_registered:
+            self.subcommands_registered = True
+            x_import(self.command_class_path).register_subcommands(main_command=self)
+            
+    def list_commands(self, ctx):
+        self.register_subcommands()
+        return super().list_commands(ctx)
+    
+    def get_command(self, ctx, cmd_name):
+        self.register_subcommands()
+        return super().get_command(ctx, cmd_name)
+
+
+class LazyCommandGroup(click.Group):
+    """
+    Click group whose commands are only built when they are listed or invoked.
+    
+    Commands are added as factories through `add_lazy_command` and turned into real
+    `click.Command` objects on first lookup, so unused commands never build their options.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = {}
+        
+    def add_lazy_command(self, name: str, factory):
+        """
+        Add a command which is built by calling `factory` on first use.
+        
+        Args:
+            name (str): The command name.
+            factory (Callable[[], click.Command]): Callable returning the command.
+        """
+        self.lazy_commands[name] = factory
+        
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+    
+    def get_command(self, ctx, cmd_name):
+        factory = self.lazy_commands.pop(cmd_name, None)
+        
+        if factory is not None:
+            self.add_command(factory(), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(cls=LazyCommandGroup, invoke_without_command=True)
 @click.option('-V', '--version', is_flag=True, help="Show the version and exit.")
 @click.pass_context
 def cli(ctx, version):
@@ -57,47 +121,41 @@ def cli(ctx, version):
     subcommand = ctx.invoked_subcommand
     
     if subcommand:
+        import setproctitle
+        
         # Set process name dynamically
         setproctitle.setproctitle(f"duck-{subcommand}")
     
     if version:
+        from duck.version import server_version
+        
         # Show the version
         click.echo(server_version)
     elif not ctx.invoked_subcommand:
         # Print usage if no subcommands are invoked
         click.echo(click.style(duck_art_small, fg='white', bold=True))
         click.echo(ctx.get_help())
-        click.echo(EXAMPLES)
+        click.echo(get_examples())
 
 
-@cli.command()
-@click.option('-y', '--skip-confirmation', is_flag=True, default=False, help="Skip confirmation prompts")
 def collectstatic(skip_confirmation):
     """
     Collect static files from Blueprints' directories.
     """
+    from duck.cli.commands.collectstatic import CollectStaticCommand
     CollectStaticCommand.main(skip_confirmation)
 
 
-@cli.command(help="Create a Duck project")
-@click.argument("name")
-@click.option("-d", "--dest", default=".", help="The destination directory to place the project (default: current directory)")
-@click.option("-O", "--overwrite", is_flag=True, help="Overwrite an existing project.")
-@click.option('--mini', 'project_type', flag_value="mini", help="Create project with minimum files and configuration")
-@click.option('--full', 'project_type', flag_value="full", help="Create project with complete files and configuration.")
-@click.option('--project-type', default='normal', type=click.Choice(["normal", "full", "mini"]), help="Specify project type")
 def makeproject(name, dest, overwrite, project_type):
     """
     Create a new project whether it's a normal, full or a mini project.
     """
+    from duck.cli.commands.makeproject import MakeProjectCommand
+    
     project_type = project_type or "normal"
     MakeProjectCommand.main(name, dest_dir=dest, overwrite_existing=overwrite, project_type=project_type)
 
 
-@cli.command(help="Create a Duck blueprint directory structure")
-@click.argument("name")
-@click.option("-d", "--dest", default="web", help="Destination for blueprint creation.")
-@click.option("-O", "--overwrite", is_flag=True, help="Overwrite an existing blueprint.")
 def makeblueprint(name, dest, overwrite):
    """
    Create a new Blueprint for organizing routes, similar to Flask's Blueprint system.
@@ -105,28 +163,18 @@ def makeblueprint(name, dest, overwrite):
    Notes:
    - It's recommended to provide camelCased names like `CounterApp`.
    """
+   from duck.cli.commands.makeblueprint import MakeBlueprintCommand
    MakeBlueprintCommand.main(name, destination=dest, overwrite_existing=overwrite)
 
 
-@cli.command(help="Execute Django management commands for your project", context_settings=dict(ignore_unknown_options=True))
-@click.argument('args', nargs=-1, type=click.UNPROCESSED)  # Accept multiple arguments
 def django(args):
     """
     Run Django-related commands in your project.
     """
+    from duck.cli.commands.django import DjangoCommand
     DjangoCommand.main()
 
 
-@cli.command(help="Start the development/production server")
-@click.option("-a","--address", default="0.0.0.0", help="The address to bind the server to (default: 0.0.0.0)")
-@click.option("-p", "--port", type=int, default=8000, help="The port to listen on (default: 8000)")
-@click.option( "-d", "--domain", default=None, help="The domain name for the server (optional)")
-@click.option("-s", "--settings", default=None, help="The settings module to use (optional)")
-@click.option("-f", "--file", default=None, help="The main python file containing app instance (optional)")
-@click.option("--ipv6", is_flag=True, default=False, help="Run application using IPV6 (optional)")
-@click.option("-dj", "--use-django", is_flag=True, default=False, help="Run application along with Django server. This overrides setting USE_DJANGO in settings.py (optional)")
-@click.option("--is-reload", is_flag=True, default=False, help="Flag the application to be in a reload state. Usually set by DuckSightReloader.")
-@click.option("--workers", default=None, help="Number of workers to use. Parse 'auto' for optimum workers.")
 def runserver(address, port, domain, settings, ipv6, file, use_django, is_reload, workers):
     """
     Run the development or production server.
@@ -136,6 +184,7 @@ def runserver(address, port, domain, settings, ipv6, file, use_django, is_reload
     if use_django:
         os.environ.setdefault("DUCK_USE_DJANGO", "true")
         
+    from duck.cli.commands.runserver import RunserverCommand
     RunserverCommand.main(
         address=address,
         port=port,
@@ -148,56 +197,30 @@ def runserver(address, port, domain, settings, ipv6, file, use_django, is_reload
     )
 
 
-@cli.command(help="Run default tests using unittest module")
-@click.option("-v", "--verbose", default=False, is_flag=True, help="More verbose tests by enabling printing to the console.")
 def runtests(verbose):
     """
     Run pre-built Duck test cases.
     """
+    from duck.cli.commands.runtests import RuntestsCommand
     RuntestsCommand.main(verbose)
 
 
-@cli.command(help="Generate a self-signed SSL certificate")
 def ssl_gen():
     """
     Generate self-signed SSL certificate.
     """
+    from duck.cli.commands.ssl_gen import SSLGenCommand
     SSLGenCommand.main()
 
 
-@cli.command(help="Integrate an existing Django project into Duck")
-@click.argument("source") 
-@click.option("-an", "--appname", default=None, help="The Django main app name, useful if main app name is different from project name (optional)")
-@click.option("-d", "--dest", default="duckapp", help="The destination name for the project when it's copied (optional). Defaults to 'duckapp' ")
 def django_add(source, appname, dest):
     """
     Integrate an existing Django project into Duck.
     """
+    from duck.cli.commands.integration import DjangoAddCommand
     DjangoAddCommand.main(source, appname, dest)
-    
 
-@cli.group()
-def service():
-    """
-    Create and manage Duck background service for linux-based systems using systemd.
-    
-    CUSTOMIZE the service in settings.py.
-    """
 
-@cli.group()
-def logs():
-    """
-    Manage Duck project logs.
-    """
-    pass
-
-
-@cli.command(help="Real-time system monitor for Duck processes")
-@click.option('--interval', default=1.0, help="Refresh interval in seconds")
-@click.option('--duck-process', default="duck*", help="Partial name of Duck processes to monitor (wildcards supported)")
-@click.option('--pid', type=int, multiple=True, help="Specific Duck process IDs to monitor instead of name")
-@click.option('--cpu-warning', default=80.0, help="CPU usage threshold for warning highlight")
-@click.option('--ram-warning', default=80.0, help="RAM usage threshold for warning highlight")
 def monitor(interval, duck_process, pid, cpu_warning, ram_warning):
     """
     Monitor Duck system metrics in real-time.
@@ -207,6 +230,7 @@ def monitor(interval, duck_process, pid, cpu_warning, ram_warning):
     - Filtering by specific process IDs
     - CPU/RAM threshold highlighting
     """
+    from duck.cli.commands.monitor import MonitorCommand
     MonitorCommand.main(
         interval=interval,
         duck_process_name=duck_process,
@@ -216,19 +240,136 @@ def monitor(interval, duck_process, pid, cpu_warning, ram_warning):
     )
 
 
-@cli.group()
-def sitemap():
+def register_commands(main_command: LazyCommandGroup):
     """
-    Create sitemap for Duck.
+    Register the Duck commands from a single table.
+    
+    Nothing is built here, each command (and its params) is only created as a
+    `click.Command` when the group looks it up, and its command module is only
+    imported inside the callback.
     """
-    pass
+    data = {
+        "collectstatic": {
+            "callback": collectstatic,
+            "params": lambda: [
+                click.Option(('-y', '--skip-confirmation'), is_flag=True, default=False, help="Skip confirmation prompts"),
+            ],
+            "help": "Collect static files from Blueprints' directories.",
+        },
+        "makeproject": {
+            "callback": makeproject,
+            "params": lambda: [
+                click.Argument(("name",)),
+                click.Option(("-d", "--dest"), default=".", help="The destination directory to place the project (default: current directory)"),
+                click.Option(("-O", "--overwrite"), is_flag=True, help="Overwrite an existing project."),
+                click.Option(('--mini', 'project_type'), flag_value="mini", help="Create project with minimum files and configuration"),
+                click.Option(('--full', 'project_type'), flag_value="full", help="Create project with complete files and configuration."),
+                click.Option(('--project-type',), default='normal', type=click.Choice(["normal", "full", "mini"]), help="Specify project type"),
+            ],
+            "help": "Create a Duck project",
+        },
+        "makeblueprint": {
+            "callback": makeblueprint,
+            "params": lambda: [
+                click.Argument(("name",)),
+                click.Option(("-d", "--dest"), default="web", help="Destination for blueprint creation."),
+                click.Option(("-O", "--overwrite"), is_flag=True, help="Overwrite an existing blueprint."),
+            ],
+            "help": "Create a Duck blueprint directory structure",
+        },
+        "django": {
+            "callback": django,
+            "params": lambda: [
+                click.Argument(('args',), nargs=-1, type=click.UNPROCESSED),  # Accept multiple arguments
+            ],
+            "help": "Execute Django management commands for your project",
+            "context_settings": dict(ignore_unknown_options=True),
+        },
+        "runserver": {
+            "callback": runserver,
+            "params": lambda: [
+                click.Option(("-a","--address"), default="0.0.0.0", help="The address to bind the server to (default: 0.0.0.0)"),
+                click.Option(("-p", "--port"), type=int, default=8000, help="The port to listen on (default: 8000)"),
+                click.Option(( "-d", "--domain"), default=None, help="The domain name for the server (optional)"),
+                click.Option(("-s", "--settings"), default=None, help="The settings module to use (optional)"),
+                click.Option(("-f", "--file"), default=None, help="The main python file containing app instance (optional)"),
+                click.Option(("--ipv6",), is_flag=True, default=False, help="Run application using IPV6 (optional)"),
+                click.Option(("-dj", "--use-django"), is_flag=True, default=False, help="Run application along with Django server. This overrides setting USE_DJANGO in settings.py (optional)"),
+                click.Option(("--is-reload",), is_flag=True, default=False, help="Flag the application to be in a reload state. Usually set by DuckSightReloader."),
+                click.Option(("--workers",), default=None, help="Number of workers to use. Parse 'auto' for optimum workers."),
+            ],
+            "help": "Start the development/production server",
+        },
+        "runtests": {
+            "callback": runtests,
+            "params": lambda: [
+                click.Option(("-v", "--verbose"), default=False, is_flag=True, help="More verbose tests by enabling printing to the console."),
+            ],
+            "help": "Run default tests using unittest module",
+        },
+        "ssl-gen": {
+            "callback": ssl_gen,
+            "params": lambda: [],
+            "help": "Generate a self-signed SSL certificate",
+        },
+        "django-add": {
+            "callback": django_add,
+            "params": lambda: [
+                click.Argument(("source",)),
+                click.Option(("-an", "--appname"), default=None, help="The Django main app name, useful if main app name is different from project name (optional)"),
+                click.Option(("-d", "--dest"), default="duckapp", help="The destination name for the project when it's copied (optional). Defaults to 'duckapp' "),
+            ],
+            "help": "Integrate an existing Django project into Duck",
+        },
+        "monitor": {
+            "callback": monitor,
+            "params": lambda: [
+                click.Option(('--interval',), default=1.0, help="Refresh interval in seconds"),
+                click.Option(('--duck-process',), default="duck*", help="Partial name of Duck processes to monitor (wildcards supported)"),
+                click.Option(('--pid',), type=int, multiple=True, help="Specific Duck process IDs to monitor instead of name"),
+                click.Option(('--cpu-warning',), default=80.0, help="CPU usage threshold for warning highlight"),
+                click.Option(('--ram-warning',), default=80.0, help="RAM usage threshold for warning highlight"),
+            ],
+            "help": "Real-time system monitor for Duck processes",
+        },
+    }
+    
+    # Groups whose subcommands are registered lazily by their command classes.
+    groups = {
+        "service": {
+            "command_class_path": "duck.cli.commands.service.ServiceCommand",
+            "help": "Create and manage Duck background service for linux-based systems using systemd.\n\nCUSTOMIZE the service in settings.py.",
+        },
+        "logs": {
+            "command_class_path": "duck.cli.commands.logs.LogsCommand",
+            "help": "Manage Duck project logs.",
+        },
+        "sitemap": {
+            "command_class_path": "duck.cli.commands.sitemap.SitemapCommand",
+            "help": "Create sitemap for Duck.",
+        },
+    }
+    
+    def command_factory(cmd_name: str, info: dict):
+        def factory():
+            return click.Command(cmd_name, **{**info, "params": info["params"]()})
+        return factory
+        
+    def group_factory(group_name: str, info: dict):
+        def factory():
+            return LazySubcommandGroup(group_name, **info)
+        return factory
+        
+    for cmd_name, info in data.items():
+        main_command.add_lazy_command(cmd_name, command_factory(cmd_name, info))
+        
+    for group_name, info in groups.items():
+        main_command.add_lazy_command(group_name, group_factory(group_name, info))
+
 
- 
-# Register subcommands the duck commands.
-ServiceCommand.register_subcommands(main_command=service)
-LogsCommand.register_subcommands(main_command=logs)
-SitemapCommand.register_subcommands(main_command=sitemap)
+# Register the duck commands.
+register_commands(main_command=cli)
 
 
 if __name__ == "__main__":
-    cli()
\ No newline at end of file
+    cli()
@@ -15,10 +15,10 @@ import os
 import sys
 import json
 import time
+import queue
 import signal
+import socket
 import threading
-import setproctitle
-import multiprocessing
 
 from typing import (
     Optional,
@@ -26,8 +26,11 @@ from typing import (
     Any,
     Union,
     Callable,
+    Tuple,
 )
-from concurrent.futures import Future
+from functools import cached_property, partial
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
 
 from duck.settings import SETTINGS
 from duck.settings.loaded import SettingsLoaded
@@ -40,13 +43,16 @@ from duck.http.core.httpd.servers import HTTPServer
 from duck.logging import logger
 from duck.meta import Meta
 from duck.csp import csp_nonce_flag
-from duck.version import version
-from duck.utils.lazy import Lazy
 from duck.utils.asyncio.eventloop import get_or_create_loop_manager
 from duck.utils.threading.threadpool import get_or_create_thread_manager
 from duck.app.base import BaseApp
 
 
+# Process-lifetime values, read once at import.
+IS_RELOAD = "--is-reload" in sys.argv # Whether this process was restarted by DuckSightReloader
+SETTINGS_MODULE = os.environ.get("DUCK_SETTINGS_MODULE", "settings") # Loaded by duck.settings on import
+
+
 class App(BaseApp):
     """
     Initializes and configures the **Duck** application.
@@ -54,8 +60,15 @@ class App(BaseApp):
     DEFAULT_ADDR = "localhost"
     DEFAULT_PORT = 8000
     
+    # IPC messages which stop the application
+    IPC_EXIT_MESSAGES = frozenset({"bye", "quit", "exit"})
+    
+    # Seconds to wait for shutdown tasks when exiting, see `stop`
+    SHUTDOWN_TIMEOUT = 5
+    
     __instances__ = 0
     __mainapp__ = None
+    __instances_lock__ = threading.Lock()
     
     def __init__(
         self,
@@ -176,23 +189,28 @@ class App(BaseApp):
               In normal environments, the IPC handler keeps the runtime
               alive and coordinated correctly.
         """
-        from duck.utils.threading.threadpool import get_or_create_thread_manager
         from duck.app.microapp import HttpsRedirectMicroApp
         
         # Runtime behavior
         self.skip_setup = skip_setup
         self.disable_signal_handler = disable_signal_handler
         self.disable_ipc_handler = disable_ipc_handler
+        
+        # Set by `handle_signal` for the IPC handler to stop the app, see `handle_ipc_messages`.
+        self.stop_requested = False
+        self.ipc_wakeup_fd = None
         self.start_bg_eventloop_if_wsgi = start_bg_eventloop_if_wsgi
         
         # Process configuration
         self.process_name = process_name or "duck-server"
+        self.process_id: int = os.getpid() # Application main process ID
         
         # Django configuration
         self.use_django = SETTINGS["USE_DJANGO"]
         self.django_server_wait_time = SETTINGS["DJANGO_SERVER_WAIT_TIME"]
         self.django_addr = addr
         self.django_bind_port = SETTINGS["DJANGO_BIND_PORT"]
+        self.django_ready = False
         
         # HTTPS redirect configuration
         self.https_redirect = SETTINGS["HTTPS_REDIRECT"]
@@ -212,10 +230,15 @@ class App(BaseApp):
         
         # Concurrent futures / threads
         self.server_future = None
+        self.server_started = threading.Event() # Set once the main server is listening
         self.django_server_future = None
         self.automations_dispatcher_future = None
         self.ducksight_reloader_thread = None
         
+        # DuckSight reloader start signals, `None` stops the reloader thread
+        self.ducksight_reloader_queue = queue.Queue()
+        self.ducksight_reloader_running = threading.Event()
+        
         # Child processes
         self.https_redirect_process = None
         
@@ -239,6 +262,8 @@ class App(BaseApp):
         
         # HTTPS redirect app
         if self.https_redirect:
+            import multiprocessing
+            
             self.https_redirect_app = HttpsRedirectMicroApp(
                 server_url=self.server_url,
                 addr=self.https_redirect_addr,
@@ -270,15 +295,16 @@ class App(BaseApp):
         # Process setup
         self.set_process_name()
         
-        # Main app singleton guard
-        if type(self).__instances__ > 0:
-            raise ApplicationError(
-                "Application limit reached: only one main application is permitted. "
-                "Use MicroApp for additional services or sub-applications."
-            )
-        
-        type(self).__instances__ += 1
-        type(self).__mainapp__ = self
+        # Main app singleton guard, check and increment atomically
+        with type(self).__instances_lock__:
+            if type(self).__instances__ > 0:
+                raise ApplicationError(
+                    "Application limit reached: only one main application is permitted. "
+                    "Use MicroApp for additional services or sub-applications."
+                )
+            
+            type(self).__instances__ += 1
+            type(self).__mainapp__ = self
 
     @classmethod
     def instances(cls) -> int:
@@ -325,6 +351,8 @@ class App(BaseApp):
         - This only focus on default `AsyncioLoopManager` & `ThreadPoolManager`.
         - The thread manager is only run in `WSGI` mode but loop manager can be run in any environment (ASGI or WSGI).
          """
+        import multiprocessing
+        
         from duck.utils.threading import get_max_workers
         from duck.setup import set_asyncio_loop
         
@@ -405,26 +433,23 @@ class App(BaseApp):
         """
         return Meta.compile()
 
-    @property
-    def process_id(self) -> int:
-        """
-        Returns the application main process ID.
-        """
-        if not hasattr(self, "_main_process_id"):
-            self._main_process_id = os.getpid()
-        return self._main_process_id    
-    
-    @property
+    @cached_property
     def absolute_uri(self) -> str:
         """
         Returns application server absolute `URL` - this is fetched using `duck.meta.Meta`.
+        
+        Notes:
+        - The value is cached until metadata is recorded again, see `record_metadata`.
         """
         return Meta.get_absolute_server_url()
         
-    @property
+    @cached_property
     def absolute_ws_uri(self) -> str:
         """
         Returns application server absolute WebSockets `URL` - this is fetched using `duck.meta.Meta`.
+        
+        Notes:
+        - The value is cached until metadata is recorded again, see `record_metadata`.
         """
         return Meta.get_absolute_ws_server_url()
 
@@ -433,38 +458,70 @@ class App(BaseApp):
         """
         Checks whether django server to forward requests to has started
 
+        Notes:
+        - Each poll is a cheap TCP probe, the first time the port accepts connections
+          a single HTTP request to `/admin` confirms Django is actually answering.
+        - Once confirmed, subsequent calls return True without probing.
+
         Returns:
             started (bool): True if up else False
         """
-        import requests
-
-        try:
-            host_addr, port = self.django_addr, self.django_bind_port
+        if self.django_ready:
+            return True
+        
+        if self._django_port_open() and self._django_http_healthy():
+            self.django_ready = True
             
-            if host_addr.startswith("0") and not self.uses_ipv6:
-                # Host 0.0.0.0 not allowed on windows
-                host_addr = "127.0.0.1"
+        return self.django_ready
+    
+    def _get_django_probe_addr(self) -> Tuple[str, int]:
+        """
+        Returns the address and port used to probe the Django server.
+        """
+        host_addr, port = self.django_addr, self.django_bind_port
+        
+        if host_addr.startswith("0") and not self.uses_ipv6:
+            # Host 0.0.0.0 not allowed on windows
+            host_addr = "127.0.0.1"
+        return host_addr, port
+        
+    def _django_port_open(self) -> bool:
+        """
+        Returns True if the Django server port accepts TCP connections.
+        """
+        try:
+            with socket.create_connection(self._get_django_probe_addr(), timeout=0.2):
+                return True
+        except OSError:
+            return False
             
-            # Note: Use /admin path as this is not usually altered like path /. Path /
-            # may be accessing real Duck path from Django side, which might be slower than
-            # /admin path, leading to ReadTimeoutError.
-            if not self.uses_ipv6:
-                url = f"http://{host_addr}:{port}/admin"
-                
-            else:
-                url = f"http://[{host_addr}]:{port}/admin"
+    def _django_http_healthy(self) -> bool:
+        """
+        Returns True if the Django server responds to an HTTP request.
+        """
+        import requests
+        
+        host_addr, port = self._get_django_probe_addr()
+        
+        # Note: Use /admin path as this is not usually altered like path /. Path /
+        # may be accessing real Duck path from Django side, which might be slower than
+        # /admin path, leading to ReadTimeoutError.
+        if not self.uses_ipv6:
+            url = f"http://{host_addr}:{port}/admin"
             
-            _ = requests.get(
+        else:
+            url = f"http://[{host_addr}]:{port}/admin"
+        
+        try:
+            requests.get(
                 url=url,
                 headers={"Host": SETTINGS["DJANGO_SHARED_SECRET_DOMAIN"]},
                 timeout=1,
             )
-
             # If we reached here, a response has been received
             return True
         except Exception:
-            pass
-        return False
+            return False
 
     @property
     def https_redirect_server_up(self) -> bool:
@@ -488,10 +545,12 @@ class App(BaseApp):
         """
         from duck.utils.port_registry import PortRegistry
         
-        super().register_ports()
+        ports = [(self.port, f"{self}")]
         
         if self.use_django:
-            PortRegistry.register_port(self.django_bind_port, "DJANGO_BIND_PORT")
+            ports.append((self.django_bind_port, "DJANGO_BIND_PORT"))
+        
+        PortRegistry.register_ports(ports)
         
     def run_checks(self):
         """
@@ -504,6 +563,8 @@ class App(BaseApp):
         """
         Set the whole process name.
         """
+        import setproctitle
+        
         setproctitle.setproctitle(self.process_name)
     
     def register_signals(self):
@@ -519,9 +580,18 @@ class App(BaseApp):
 
         Signals:
         - `SIGINT` (Ctrl-C), `SIGTERM` (Terminate): Quits the server/application.
+
+        Notes:
+        - While the IPC handler is running, this only flags the stop request and wakes the handler up,
+          so `stop` runs outside the signal handler and cannot deadlock on locks held by interrupted code.
         """
         if sig in [signal.SIGINT, signal.SIGTERM]:
-            self.stop(wait_for_runtime_executor_shutdown=False)
+            if self.ipc_wakeup_fd is not None:
+                # Signal-safe: no locks are taken here.
+                self.stop_requested = True
+                os.write(self.ipc_wakeup_fd, b"\0")
+            else:
+                self.stop(wait_for_runtime_executor_shutdown=False)
             
     def handle_ipc_messages(self):
         """
@@ -529,25 +599,61 @@ class App(BaseApp):
         
         Notes:
         - This usually holds the main process from exiting because of the blocking behavior.
+        - The shared file is watched for modifications, so this blocks without waking up until a
+          message is written or a stop signal is received. It falls back to polling if the file cannot be watched.
         """
         from duck.utils import ipc
         
+        # Self-pipe, written to on file modifications and by `handle_signal`.
+        wakeup_r, wakeup_w = os.pipe()
+        observer = None
+        
         with ipc.get_reader() as reader:
             with ipc.get_writer() as writer:
                 # Clear IPC writer file
                 writer.write_message("")  # Clear ipc shared file
             
-            while True:
-                # Handle any incoming message.
-                message = reader.read_message().strip()
+            try:
+                # Get notified whenever a new message is written
+                observer = ipc.watch_file(reader.filepath, lambda: os.write(wakeup_w, b"\0"))
+            except OSError as e:
+                # Watch limit reached or unsupported filesystem
+                logger.log(f"Cannot watch IPC file, polling instead: {e}", level=logger.WARNING)
                 
-                if message:
-                    if any({message.lower() == i for i in ["bye", "quit", "exit"]}):
-                        self.stop()
+            try:
+                self.ipc_wakeup_fd = wakeup_w
+                
+                while True:
+                    if self.stop_requested:
+                        # Stop requested by signal handler, stop from here instead.
+                        self.stop(wait_for_runtime_executor_shutdown=False)
                         break
-                                
-                # Simulate some delay
-                time.sleep(1)
+                        
+                    # Handle any incoming message.
+                    message = reader.read_message().strip()
+                    
+                    if message:
+                        if message.lower() in self.IPC_EXIT_MESSAGES:
+                            self.stop()
+                            break
+                    
+                    # Wait for the next message or signal (or poll every second if not watching).
+                    # Wakeups arriving after the read above stay in the pipe, so none are missed.
+                    if observer:
+                        os.read(wakeup_r, 4096)
+                    else:
+                        time.sleep(1)
+            finally:
+                # Nothing may write to the pipe once it's closed (its fds could be reused by then), so
+                # clear the fd used by `handle_signal` and wait for the observer thread to exit first.
+                self.ipc_wakeup_fd = None
+                
+                if observer:
+                    observer.stop()
+                    observer.join()
+                    
+                os.close(wakeup_r)
+                os.close(wakeup_w)
                 
     def record_metadata(self):
         """
@@ -569,13 +675,20 @@ class App(BaseApp):
         
         # Update global metadata.
         Meta.update_meta(data)
+        
+        # Drop cached URLs so they are recomputed from the new metadata.
+        self.__dict__.pop("absolute_uri", None)
+        self.__dict__.pop("absolute_ws_uri", None)
     
     def start_server(self) -> None:
         """
         Starts the app server in new thread.
         """  
         if not self.server_future or not self.server_future.running():
-            self.server_future = self.runtime_executor.submit_task(self.server.start_server)
+            self.server_started.clear()
+            self.server_future = self.runtime_executor.submit_task(
+                partial(self.server.start_server, on_server_start_fn=self.server_started.set)
+            )
                 
     def start_django_server(self) -> None:
         """
@@ -609,6 +722,9 @@ class App(BaseApp):
         Args:
             log_message (bool): Whether to log something before starting the micro app.
         """
+        import multiprocessing
+        import setproctitle
+        
         def start_https_redirect(process_safe_running_state: multiprocessing.Value):
             """
             Starts app for redirecting non encrypted traffic to main app using https.
@@ -628,7 +744,7 @@ class App(BaseApp):
             # Restart only request handling threadpool/eventloop manager
             _async = SETTINGS['ASYNC_HANDLING']
             start_bg_eventloop_if_wsgi = getattr(self, "start_bg_eventloop_if_wsgi", True)
-            start_eventloop = _async or (not _async and start_bg_eventloop_if_wsgi)
+            start_eventloop = _async or start_bg_eventloop_if_wsgi
             
             App.start_background_workers(
                 self,
@@ -705,19 +821,35 @@ class App(BaseApp):
         from duck.contrib.reloader.ducksight import DuckSightReloader
         
         # Note: Production server should not be restarted at any point only start duck sight reloader on DEBUG
-        def start_reloader():
-            """
-            Start the app's reloader.'
-            """
+        if SETTINGS["DEBUG"] and SETTINGS['AUTO_RELOAD']:
             if not self.ducksight_reloader:
                 self.ducksight_reloader = DuckSightReloader(SETTINGS['BASE_DIR'])
-            self.ducksight_reloader.run()
-            
-        if SETTINGS["DEBUG"] and SETTINGS['AUTO_RELOAD']:
-            if not self.ducksight_reloader_thread or not self.ducksight_reloader_thread.is_alive():
-                if not self.ducksight_reloader_thread:
-                    self.ducksight_reloader_thread = threading.Thread(target=start_reloader)
+                
+            if not self.ducksight_reloader_thread:
+                # The thread is created once and waits for start signals, see `_ducksight_reloader_worker`.
+                self.ducksight_reloader_thread = threading.Thread(
+                    target=self._ducksight_reloader_worker,
+                    name="ducksight-reloader",
+                    daemon=True,
+                )
                 self.ducksight_reloader_thread.start()
+            
+            if not self.ducksight_reloader_running.is_set() and self.ducksight_reloader_queue.empty():
+                self.ducksight_reloader_queue.put(True)
+    
+    def _ducksight_reloader_worker(self):
+        """
+        Runs the DuckSight reloader each time a start signal is received, exits on a `None` signal.
+        """
+        while self.ducksight_reloader_queue.get() is not None:
+            self.ducksight_reloader_running.set()
+            
+            try:
+                self.ducksight_reloader.run()
+            except Exception as e:
+                logger.log_exception(e)
+            finally:
+                self.ducksight_reloader_running.clear()
                             
     def get_runtime_futures(self) -> Dict[str, Optional[Future]]:
         """
@@ -746,19 +878,36 @@ class App(BaseApp):
             log_to_console (bool): Whether to an exit message log to console.
             wait (bool): Whether to wait for termination. Defaults to True but with a timeout.
         """
-        self.server.stop_server(log_to_console=log_to_console, wait=wait)
+        child_processes = []
         
         if (
             stop_https_redirect_server and self.https_redirect_process
             and self.https_redirect_process.is_alive()
         ):
-            
-            # Terminate https redirect app process
-            self.https_redirect_process.terminate()
-            
-            if wait:
-                # Wait for termination
-                self.https_redirect_process.join(1)
+            child_processes.append(self.https_redirect_process)
+        
+        # Ask child processes to terminate first so they shut down while the main server stops.
+        for process in child_processes:
+            try:
+                process.terminate()
+            except Exception as e:
+                logger.log_exception(e)
+        
+        # Stop the main server.
+        deadline = time.monotonic() + 1
+        self.server.stop_server(log_to_console=log_to_console, wait=wait)
+        
+        if wait:
+            # Wait for termination with a shared deadline, then kill any process still alive.
+            for process in child_processes:
+                try:
+                    process.join(max(0, deadline - time.monotonic()))
+                    
+                    if process.is_alive():
+                        process.kill()
+                        process.join(0.5)
+                except Exception as e:
+                    logger.log_exception(e)
     
     def stop(
         self,
@@ -782,65 +931,94 @@ class App(BaseApp):
                                                                                             This is only used if argument `no_exit=True` else it is automatically `False`.
             close_log_file (bool): Whether to close the log file. Defaults to True.
         """
-        if "--is-reload" in sys.argv:
+        if IS_RELOAD:
             log_to_console = False
             
-        def stop_future(future):
-            """
-            Stops a running running future safely.
-            """
-            if future and future.running():
-                try:
-                    future.cancel()
-                except Exception:
-                    # Ignore as the thread_pool_executor is going to be shut down anyway if it's still running.
-                    pass
-                    
         if dispatch_pre_stop_event:
             # Dispatch pre stop event.
             self.dispatch_event("on_pre_stop")
         
-        try:
-            # Close the session storage connector in new thread
-            SettingsLoaded.SESSION_STORAGE_CONNECTOR.close()
-        except Exception as e:
-            logger.log_raw('\n')
-            logger.log(f"Error closing session storage: {e}", level=logger.WARNING)
-
-        try:
-            # Stop all started servers
-            self.stop_servers(log_to_console=log_to_console, wait=wait_for_runtime_executor_shutdown if no_exit else False)
-        except Exception as e:
-            logger.log_raw('\n')
-            logger.log(f"Error stopping servers: {e}", level=logger.ERROR)
-            
-            if SETTINGS['DEBUG']:
-                logger.log_exception(e)
+        def close_session_storage():
+            """
+            Closes the session storage connector.
+            """
+            try:
+                # Close the session storage connector
+                SettingsLoaded.SESSION_STORAGE_CONNECTOR.close()
+            except Exception as e:
+                logger.log_raw('\n')
+                logger.log(f"Error closing session storage: {e}", level=logger.WARNING)
                 
-        # Try cancel other cancelable components.
-        if self.run_automations:
+        def stop_servers():
+            """
+            Stops all started servers.
+            """
+            try:
+                # Stop all started servers
+                self.stop_servers(log_to_console=log_to_console, wait=wait_for_runtime_executor_shutdown if no_exit else False)
+            except Exception as e:
+                logger.log_raw('\n')
+                logger.log(f"Error stopping servers: {e}", level=logger.ERROR)
+                
+                if SETTINGS['DEBUG']:
+                    logger.log_exception(e)
+                    
+        def stop_automations_dispatcher():
+            """
+            Stops the automations dispatcher.
+            """
             try:
                 self.automations_dispatcher.stop()
             except Exception as e:
                 logger.log_exception(e)
         
+        shutdown_tasks = [close_session_storage, stop_servers]
+        
+        if self.run_automations:
+            shutdown_tasks.append(stop_automations_dispatcher)
+            
+        # Run independent shutdown tasks concurrently, so shutdown takes as long as the slowest one.
+        shutdown_executor = ThreadPoolExecutor(max_workers=len(shutdown_tasks), thread_name_prefix="app-shutdown")
+        
+        try:
+            futures = [shutdown_executor.submit(task) for task in shutdown_tasks]
+        except RuntimeError:
+            # New futures cannot be scheduled once the interpreter is shutting down, e.g. when stopping
+            # from a signal handler or a background thread after the main thread has exited.
+            futures = None
+            
+        try:
+            if futures is None:
+                for task in shutdown_tasks:
+                    task()
+            else:
+                _, pending = wait_futures(
+                    futures,
+                    timeout=None if (no_exit and wait_for_runtime_executor_shutdown) else self.SHUTDOWN_TIMEOUT,
+                )
+                
+                if pending:
+                    logger.log(f"Shutdown tasks still running after {self.SHUTDOWN_TIMEOUT}s, not waiting", level=logger.WARNING)
+        finally:
+            shutdown_executor.shutdown(wait=False)
+        
         # Try cancel other cancelable components.
         if SETTINGS['DEBUG'] and SETTINGS['AUTO_RELOAD'] and kill_ducksight_reloader:
             try:
                 self.ducksight_reloader.stop() if self.ducksight_reloader else None
             except Exception as e:
                 logger.log_exception(e)
+            
+            # Let the reloader thread exit once the reloader returns.
+            self.ducksight_reloader_queue.put(None)
                 
-        # Cancel all running futures
-        concurrent_futures = self.get_runtime_futures()
-        
-        for name, future in concurrent_futures.items():
-            stop_future(future)
-        
-        # Shutdown runtime executor if not stopped.            
+        # Shutdown runtime executor if not stopped, pending tasks are cancelled in one pass.
         if self.runtime_executor:
             try:
-                self.runtime_executor.stop(wait=wait_for_runtime_executor_shutdown if no_exit else False)
+                self.runtime_executor.stop(
+                    wait=wait_for_runtime_executor_shutdown if no_exit else False,
+                    cancel_futures=True,
+                )
             except Exception as e:
                 logger.log_exception(e)
         
@@ -915,40 +1093,24 @@ class App(BaseApp):
         if not (SETTINGS['ENABLE_HEADERS_SECURITY_POLICY'] and csp_directives):
             return
     
-        script_src = set(csp_directives.get("script-src", []))
-        style_src = set(csp_directives.get("style-src", []))
-        
-        # Script flags
-        required_script_flags = {"'unsafe-eval'"}
-        missing_script_flags = [
-            flag for flag in required_script_flags
-            if flag not in script_src
-        ]
-        
-        # Style flags
-        required_style_flag = "'unsafe-inline'"
-    
-        if "'unsafe-eval'" not in script_src:
-            logger.log(
-                (
-                    f"Component system active but script flag {'unsafe-eval'} "
-                    "is missing from script-src. "
-                    "This may prevent JS execution from lively components."
-                ),
-                level=logger.WARNING,
-            )
+        script_src = frozenset(csp_directives.get("script-src", ()))
+        style_src = frozenset(csp_directives.get("style-src", ()))
         
-        elif missing_script_flags:
+        # Missing flags, checked independently so every warning is logged.
+        missing_script_flags = frozenset({"'unsafe-eval'"}) - script_src
+        missing_style_flags = frozenset({"'unsafe-inline'"}) - style_src
+        
+        if missing_script_flags:
             logger.log(
                 (
                     f"Component system active but script flag(s) "
-                    f"{', '.join(missing_script_flags)} are missing from script-src. "
-                    "This may prevent dynamic components from loading correctly."
+                    f"{', '.join(sorted(missing_script_flags))} are missing from script-src. "
+                    "This may prevent JS execution from lively components."
                 ),
                 level=logger.WARNING,
             )
         
-        elif csp_nonce_flag in style_src:
+        if csp_nonce_flag in style_src:
             logger.log(
                 (
                     "Component system active but `csp_nonce_flag` is in style-src. "
@@ -957,11 +1119,11 @@ class App(BaseApp):
                 level=logger.WARNING,
             )
         
-        elif required_style_flag not in style_src:
+        if missing_style_flags:
             logger.log(
                 (
-                    f"Component system active but flag {required_style_flag} "
-                    "is missing from style-src. "
+                    f"Component system active but flag(s) "
+                    f"{', '.join(sorted(missing_style_flags))} are missing from style-src. "
                     "This may block inline styles from components."
                 ),
                 level=logger.WARNING,
@@ -989,7 +1151,7 @@ class App(BaseApp):
         # No workers — start everything ourselves
         async_ = SETTINGS['ASYNC_HANDLING']
         start_bg_eventloop_if_wsgi = getattr(self, "start_bg_eventloop_if_wsgi", True)
-        start_eventloop = async_ or (not async_ and start_bg_eventloop_if_wsgi)
+        start_eventloop = async_ or start_bg_eventloop_if_wsgi
     
         App.start_background_workers(
             self,
@@ -1009,9 +1171,30 @@ class App(BaseApp):
                     level=logger.WARNING,
                 )
     
+    @staticmethod
+    def wait_until(condition: Callable[[], bool], timeout: float, interval: float = 0.05) -> bool:
+        """
+        Polls a condition until it is true or the timeout expires.
+        
+        Args:
+            condition: Callable returning True once the awaited state is reached.
+            timeout: Maximum time to wait in seconds.
+            interval: Time to sleep between checks in seconds.
+        
+        Returns:
+            bool: The last result of `condition`.
+        """
+        deadline = time.monotonic() + timeout
+        
+        while not condition():
+            if time.monotonic() >= deadline:
+                return condition()
+            time.sleep(interval)
+        return True
+        
     def wait_for_main_server(self, start_failure_msg: str) -> bool:
         """
-        Waits briefly then checks whether the main server came up.
+        Waits until the main server signals it is listening, or for a short timeout.
     
         Args:
             start_failure_msg: Message to log if the server failed to start.
@@ -1022,10 +1205,10 @@ class App(BaseApp):
         wait_t = 1
         
         # Log something to the console.
-        logger.log(f"Waiting {wait_t}s to read server state...", level=logger.DEBUG)
+        logger.log(f"Waiting up to {wait_t}s to read server state...", level=logger.DEBUG)
         
-        # Wait for sometime.
-        time.sleep(wait_t)
+        # Wait for the server start signal.
+        self.server_started.wait(wait_t)
     
         if not self.server_up:
             # Log failure message and stop the application.
@@ -1039,9 +1222,16 @@ class App(BaseApp):
     
         return True
     
-    def start_https_redirect_if_needed(self, start_failure_msg: str) -> bool:
+    def start_https_redirect_if_needed(self) -> None:
         """
-        Starts the HTTPS redirect server if configured.
+        Starts the HTTPS redirect server if configured, without waiting for it.
+        """
+        if self.https_redirect:
+            self.start_https_redirect_server()
+            
+    def wait_for_https_redirect_server(self, start_failure_msg: str) -> bool:
+        """
+        Waits for the HTTPS redirect server to come up if configured.
     
         Args:
             start_failure_msg: Fallback message used if the redirect server fails.
@@ -1051,14 +1241,9 @@ class App(BaseApp):
         """
         if not self.https_redirect:
             return True
-    
-        # Start the HTTPS redirect server.
-        self.start_https_redirect_server()
         
-        # Wait for sometime.
-        time.sleep(1)
-    
-        if not self.https_redirect_server_up:
+        # Wait until the redirect server is up.
+        if not self.wait_until(lambda: self.https_redirect_server_up, timeout=1):
             # Log a failure message and stop the application.
             logger.log(start_failure_msg, level=logger.ERROR)
             
@@ -1072,14 +1257,12 @@ class App(BaseApp):
     
     def start_django_if_needed(self) -> bool:
         """
-        Starts the Django server and waits for it to become responsive.
+        Starts the Django server if in use, without waiting for it.
     
-        Runs any configured startup commands, then waits the configured grace
-        period before checking Django's health. Logs success details on a clean
-        start or an error and stops the app on failure.
+        Runs any configured startup commands first, stopping the app if they fail.
     
         Returns:
-            True if Django started successfully (or is not in use), False otherwise.
+            True if Django was started (or is not in use), False otherwise.
         """
         from duck.backend.django import bridge
         
@@ -1105,23 +1288,35 @@ class App(BaseApp):
                 logger.log_exception(e)
                 self.stop()
                 return False
+        
+        # Start the django server.
+        self.start_django_server()
+        return True
+    
+    def wait_for_django_server(self) -> bool:
+        """
+        Waits for the Django server to become responsive if in use.
+    
+        Waits up to the configured grace period for Django's health check.
+        Logs success details on a clean start or an error and stops the app on failure.
     
+        Returns:
+            True if Django started successfully (or is not in use), False otherwise.
+        """
+        if not self.use_django:
+            return True
+            
         # Wait for Django server to start
         wait_t = self.django_server_wait_time
         
         # Log something.
         logger.log(
-            f"Waiting for Django server to start ({wait_t} secs)\n",
+            f"Waiting for Django server to start (up to {wait_t} secs)\n",
             level=logger.DEBUG,
         )
         
-        # Start the django server.
-        self.start_django_server()
-        
-        # Wait for some time.
-        time.sleep(wait_t)
-    
-        if not self.django_server_up:
+        # Wait until Django is up.
+        if not self.wait_until(lambda: self.django_server_up, timeout=wait_t):
             # Log a failure message.
             logger.log(
                 f"Failed to get response from Django server [{wait_t} secs]",
@@ -1176,8 +1371,12 @@ class App(BaseApp):
         # Record application metadata and run the server
         self.record_metadata()
         
-        # Start runtime executor
-        self.runtime_executor.start(max_workers=5)
+        # Start runtime executor, each runtime task (e.g. the main server) blocks a single thread
+        # for the app lifetime, so only that many threads are needed.
+        self.runtime_executor.start(
+            max_workers=len(self.get_runtime_futures()),
+            thread_name_prefix="app-runtime",
+        )
         
         # Run the main application
         return self._run(print_ansi_art=print_ansi_art)
@@ -1207,10 +1406,10 @@ class App(BaseApp):
         bold_start = "\033[1m"
         bold_end = "\033[0m"
         start_failure_msg = f"{bold_start}Failed to start Duck server{bold_end}"
-        settings_mod = os.environ.get("DUCK_SETTINGS_MODULE", "settings")
+        settings_mod = SETTINGS_MODULE
         
         # Handle reload state — skip art and extra setup if restarting
-        is_reload = "--is-reload" in sys.argv
+        is_reload = IS_RELOAD
         
         if is_reload:
             logger.log_raw("")
@@ -1234,16 +1433,20 @@ class App(BaseApp):
         if self.run_automations:
             self.start_automations_dispatcher()
     
-        # Boot main server and verify it came up
+        # Boot all servers first so they start concurrently, then verify each came up
         self.start_server()
+        self.start_https_redirect_if_needed()
+        
+        if not self.start_django_if_needed():
+            return
         
         if not self.wait_for_main_server(start_failure_msg):
             return
     
-        if not self.start_https_redirect_if_needed("HTTPS redirect app failed to start"):
+        if not self.wait_for_https_redirect_server("HTTPS redirect app failed to start"):
             return
     
-        if not self.start_django_if_needed():
+        if not self.wait_for_django_server():
             return
     
         # Call on app start callable.
@@ -1316,4 +1519,6 @@ class App(BaseApp):
 
 
 if __name__ == "__main__":
+    import multiprocessing
+    
     multiprocessing.freeze_support()
@@ -3,6 +3,7 @@ Base application primitives shared by Duck application classes.
 """
 
 from typing import Optional, Dict, Callable
+from functools import cached_property
 
 from duck.exceptions.all import ApplicationError
 from duck.meta import Meta
@@ -115,17 +116,23 @@ class BaseApp:
         """
         return bool(self.server and self.server.running)
     
-    @property
+    @cached_property
     def absolute_uri(self) -> str:
         """
         Returns application server absolute `URL`.
+        
+        Notes:
+        - The value is computed once, `server_url` does not change after initialization.
         """
         return self.server_url
         
-    @property
+    @cached_property
     def absolute_ws_uri(self) -> str:
         """
         Returns application server absolute WebSockets `URL`.
+        
+        Notes:
+        - The value is computed once, `server_url` does not change after initialization.
         """
         url = self.server_url
         url_obj = URL(url)
@@ -212,7 +219,7 @@ class BaseApp:
         resolved_domain = domain or (f"[{addr}]" if uses_ipv6 else addr)
 
         # Avoid exposing 0.0.0.0 as a browser URL
-        if is_ipv4(resolved_domain) and resolved_domain.startswith("0"):
+        if resolved_domain.startswith("0") and is_ipv4(resolved_domain):
             return "localhost"
 
         return resolved_domain
@@ -5,7 +5,6 @@ Notes:
 - `Mini applications` run independently on their own individual ports.
 - An example of a mini app is Duck's internal `HttpsRedirectApp` which is used to redirect HTTP traffic to a more secure HTTPS server.
 """
-import time
 import threading
 
 from typing import Union, Optional, Dict, Callable
@@ -20,6 +19,7 @@ from duck.http.response import HttpResponse
 from duck.contrib.sync import ensure_async, ensure_sync
 from duck.utils.urlcrack import URL
 from duck.shortcuts import redirect
+from duck.settings.loaded import SettingsLoaded
 from duck.app.base import BaseApp
 
 
@@ -110,6 +110,9 @@ class MicroApp(BaseApp):
         # Assign server thread to None
         self.server_thread = None
         
+        # Set on stop, `run(run_forever=True)` blocks on this.
+        self.stopped = threading.Event()
+        
     def start_server(self):
         """
         Starts the server in a new thread.
@@ -118,10 +121,17 @@ class MicroApp(BaseApp):
             """
             Wrapper for server start.
             """
+            failed = True
             try:
                 self.server.start_server(*args, **kw)
+                failed = False
             except KeyboardInterrupt:
-                pass
+                failed = False
+            finally:
+                # With workers, start_server returns while the server keeps running, so only
+                # release `run()` if the server died (e.g. bind failed) or is no longer running.
+                if failed or not self.server.running:
+                    self.stopped.set()
                 
         if not self.server_thread or not self.server_thread.is_alive():
             # Set the server thread
@@ -138,23 +148,27 @@ class MicroApp(BaseApp):
         Runs the duck sub-application.
         
         Args:
-            run_forever (bool): Whether to run a while loop to avoid app from exiting.
+            run_forever (bool): Whether to block until the app is stopped, to avoid app from exiting.
                                               Server is always run in background and setting `run_forever=False` will make this method return 
                                               immediately after starting the background thread.
         """
         # Start the server in a new thread - only if not running.
+        self.stopped.clear()
         self.start_server()
         
-        while run_forever:
-            # Just sleep for 5 seconds
-            time.sleep(5)
+        if run_forever:
+            # Block until the micro app is stopped.
+            self.stopped.wait()
             
     def stop(self):
         """
         Stops the current running micro-application.
         """
-        self.dispatch_event("on_pre_stop")
-        self.server.stop_server(log_to_console=not self.no_logs)
+        try:
+            self.dispatch_event("on_pre_stop")
+            self.server.stop_server(log_to_console=not self.no_logs)
+        finally:
+            self.stopped.set()
     
     def view(self, request: HttpRequest, processor: Union[AsyncRequestProcessor, RequestProcessor]) -> HttpResponse:
         """
@@ -198,8 +212,6 @@ class MicroApp(BaseApp):
             request (HttpRequest): The http request object.
             processor (RequestProcessor): Default request processor which may be used to process request.
         """
-        from duck.settings.loaded import SettingsLoaded
-        
         # Get response from view method
         response = ensure_sync(self.view)(request, processor)
         
@@ -217,8 +229,6 @@ class MicroApp(BaseApp):
             request (HttpRequest): The http request object.
             processor (AsyncRequestProcessor): Default asynchronous request processor which may be used to process request.
         """
-        from duck.settings.loaded import SettingsLoaded
-        
         # Get response from view method
         response = await ensure_async(self.async_view)(request, processor)
         
@@ -237,14 +247,12 @@ class HttpsRedirectMicroApp(MicroApp):
         """
         Returns an HTTP redirect response.
         """
-        # Create destination URL
-        dest_url_obj = URL(self.absolute_uri)
-        
-        # Edit the destination URL object inplace
-        dest_url_obj.innerjoin(request.fullpath)
+        # Create destination URL, joining strings directly avoids building and
+        # reparsing an intermediate URL object for the base on every request.
+        dest_url = URL.urljoin(self.absolute_uri, request.fullpath)
         
         # Return response
-        return redirect(dest_url_obj.to_str(), permanent=False)
+        return redirect(dest_url, permanent=False)
 
     async def async_view(self, request: HttpRequest, request_processor: AsyncRequestProcessor) -> HttpResponse:
         """
@@ -46,36 +46,24 @@ SIMPLE_CONFIG  = {
 
 if SETTINGS["DJANGO_SILENT"]:
     HANDLERS = ["null"]
-
-    SIMPLE_CONFIG = {
-        "version": 1,
-        "disable_existing_loggers": False,
-        "formatters": {
-            "exception_only": {
-                "format": "{message}",
-                "style": "{"
-            }
-        },
-        "handlers": {
-            "null": {
-                "class": "logging.NullHandler",
-            },
-        },
-        "loggers": {
-            "django": {"handlers": ["null"], "propagate": True},
-            "django.request": {"handlers": ["null"], "propagate": False},
-            "django.server": {"handlers": ["null"], "propagate": False},
-            "": {"handlers": ["null"], "propagate": False},  # Catch all
+    
+    # Swap handlers and loggers in place, formatters are shared.
+    SIMPLE_CONFIG["handlers"] = {
+        "null": {
+            "class": "logging.NullHandler",
         },
     }
+    SIMPLE_CONFIG["loggers"] = {
+        "django": {"handlers": HANDLERS, "propagate": True},
+        "django.request": {"handlers": HANDLERS, "propagate": False},
+        "django.server": {"handlers": HANDLERS, "propagate": False},
+        "": {"handlers": HANDLERS, "propagate": False},  # Catch all
+    }
 
 
 if SETTINGS["LOG_TO_FILE"] and not is_testing_environment():
     LATEST_LOGFILE = logger.Logger.get_current_logfile()
     
-    # Edit handlers
-    HANDLERS.append("error_file")
-    
     # Add the error_file handler
     SIMPLE_CONFIG["handlers"]["error_file"] = {
         "level": "ERROR",
@@ -83,7 +71,6 @@ if SETTINGS["LOG_TO_FILE"] and not is_testing_environment():
         "filename": LATEST_LOGFILE,
         "formatter": "exception_only",
     }
-
-    # Edit handlers for available loggers
-    for key in SIMPLE_CONFIG["loggers"].keys():
-        SIMPLE_CONFIG['loggers'][key]["handlers"].append("error_file")
+    
+    # All loggers share the HANDLERS list, so this adds the handler to each of them once.
+    HANDLERS.append("error_file")
@@ -23,15 +23,10 @@ class DjangoCommand:
         # This command uses sys.argv to retrieve command arguments.
         from duck.backend.django.utils import execute_from_command_line
         
-        command_args = []
-        
-        keyword_reached = False
-        for arg in sys.argv:
-            if not keyword_reached:
-                if arg.strip() == "django":
-                    keyword_reached = True
-            else:
-                command_args.append(arg)
+        try:
+            command_args = sys.argv[sys.argv.index("django") + 1:]
+        except ValueError:
+            command_args = []
         
         command = ["manage.py", *command_args]
         execute_from_command_line(command)
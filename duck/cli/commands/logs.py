@@ -5,7 +5,8 @@ import os
 import click
 
 from pathlib import Path
-from typing import List
+from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
 
 from duck.logging import console
 
@@ -14,6 +15,16 @@ class LogsCommand:
     """
     CLI command group for managing Duck project logs.
     """
+    SORT_TYPES = ("oldest", "newest", "largest")
+    """
+    Supported criteria for sorting logs.
+    """
+    
+    PARALLEL_PURGE_THRESHOLD = 8
+    """
+    Minimum number of logs for `purge_logs` to delete them in parallel.
+    """
+    
     @classmethod
     def get_logs_dir(cls) -> Path:
         """
@@ -24,9 +35,12 @@ class LogsCommand:
         return Path(logsdir).resolve() if not isinstance(logsdir, Path) else logsdir.resolve()
 
     @classmethod
-    def _get_log_files(cls) -> List[Path]:
+    def _get_log_files(cls) -> List[os.DirEntry]:
         """
-        Return a list of log file paths in the logs directory.
+        Return a list of log file entries in the logs directory.
+        
+        Notes:
+        - `os.DirEntry` caches `stat()` results, so sorting and sizing logs stats each file only once.
         """
         logsdir = cls.get_logs_dir()
         
@@ -34,31 +48,41 @@ class LogsCommand:
             console.log_raw(f"Log directory not found: {logsdir}", level=console.WARNING)
             return []
         
-        return [p for p in logsdir.iterdir() if p.is_file()]
+        with os.scandir(logsdir) as entries:
+            return [entry for entry in entries if entry.is_file()]
 
-    @staticmethod
-    def _sort_logs(logs: List[Path], sort: str) -> List[Path]:
+    @classmethod
+    def _resolve_sort(cls, sort: str) -> str:
+        """
+        Validate the sort criteria, this is done before reading the logs directory.
         """
-        Sort logs based on criteria.
+        if sort not in cls.SORT_TYPES:
+            console.log_raw(f"Unknown sort type '{sort}', defaulting to 'oldest'.", level=console.WARNING)
+            return "oldest"
+        return sort
+        
+    @staticmethod
+    def _sort_logs(logs: List[os.DirEntry], sort: str) -> List[os.DirEntry]:
         """
-        if sort == "oldest":
-            return sorted(logs, key=lambda f: f.stat().st_mtime)
+        Sort logs based on criteria, `sort` must be one of `SORT_TYPES`.
         
-        elif sort == "newest":
+        Notes:
+        - `os.DirEntry.stat()` is cached, later `stat()` calls on the same entries do not hit the filesystem.
+        """
+        if sort == "newest":
             return sorted(logs, key=lambda f: f.stat().st_mtime, reverse=True)
         
         elif sort == "largest":
             return sorted(logs, key=lambda f: f.stat().st_size, reverse=True)
         
-        else:
-            console.log_raw(f"Unknown sort type '{sort}', defaulting to 'oldest'.", level=console.WARNING)
-            return sorted(logs, key=lambda f: f.stat().st_mtime)
+        return sorted(logs, key=lambda f: f.stat().st_mtime)
 
     @classmethod
     def list_logs(cls, max: int = -1, sort: str = "oldest", show_size: bool = False):
         """
         List Duck project logs.
         """
+        sort = cls._resolve_sort(sort)
         logs = cls._get_log_files()
         maxlogs = max
         
@@ -80,6 +104,7 @@ class LogsCommand:
         """
         Delete logs, optionally limited by count and sorted by criteria.
         """
+        sort = cls._resolve_sort(sort)
         logs = cls._get_log_files()
         maxlogs = max
         
@@ -92,12 +117,29 @@ class LogsCommand:
         if maxlogs > 0:
             logs = logs[:maxlogs]
 
-        for log in logs:
-            try:
-                log.unlink()
+        if len(logs) < cls.PARALLEL_PURGE_THRESHOLD:
+            errors = map(cls._safe_unlink, logs)
+        else:
+            # Pipeline unlinks, this helps on network filesystems where each unlink is a round trip.
+            with ThreadPoolExecutor(max_workers=min(32, len(logs))) as executor:
+                errors = list(executor.map(cls._safe_unlink, logs))
+                
+        # Log results in order from this thread.
+        for log, error in zip(logs, errors):
+            if error is None:
                 console.log_raw(f"Deleted {log.name}", level=console.WARNING)
-            except OSError as e:
-                console.print(f"Failed to delete {log.name}: {e}", level=console.ERROR)
+            else:
+                console.print(f"Failed to delete {log.name}: {error}", level=console.ERROR)
+                
+    @staticmethod
+    def _safe_unlink(log: os.DirEntry) -> Optional[OSError]:
+        """
+        Delete a log file, returning the error instead of raising it.
+        """
+        try:
+            os.unlink(log.path)
+        except OSError as e:
+            return e
 
     @classmethod
     def count_logs(cls):
@@ -108,20 +150,40 @@ class LogsCommand:
         console.log_raw(f"{len(logs)} log(s) found.", level=console.DEBUG)
 
     @classmethod
-    def get_logs_size(cls, fmt: str = "kb"):
+    def get_logs_size(cls, fmt: str = "kb", use_statvfs: bool = False):
         """
         Get the total size of all logs.
-        """
-        logs = cls._get_log_files()
-        total_size = sum(log.stat().st_size for log in logs)
+        
+        Args:
+            fmt (str): Size unit, one of b, kb, mb or gb.
+            use_statvfs (bool): Report the used space of the filesystem holding the logs directory using a single
+                `os.statvfs` call instead of summing every log file. Only accurate if the logs directory is on
+                a dedicated filesystem, as this reports usage of the whole filesystem.
+        """
+        if use_statvfs and not hasattr(os, "statvfs"):
+            console.log_raw("os.statvfs is not available on this platform, summing log sizes instead.", level=console.WARNING)
+            use_statvfs = False
+            
+        if use_statvfs:
+            logsdir = cls.get_logs_dir()
+            
+            if not logsdir.exists():
+                console.log_raw(f"Log directory not found: {logsdir}", level=console.WARNING)
+                return
+                
+            stat = os.statvfs(logsdir)
+            total_size = (stat.f_blocks - stat.f_bfree) * stat.f_frsize
+        else:
+            total_size = sum(log.stat().st_size for log in cls._get_log_files())
 
         unit_map = {"b": 1, "kb": 1024, "mb": 1024**2, "gb": 1024**3}
         fmt = fmt.lower()
         divisor = unit_map.get(fmt, 1024)
         formatted_size = total_size / divisor
         
-        # Print to console
-        console.log_raw(f"Total logs size: {formatted_size:.2f} {fmt.upper()}", level=console.DEBUG)
+        # Print to console, statvfs reports the whole filesystem so don't present it as the logs size
+        label = "Filesystem used (logs dir)" if use_statvfs else "Total logs size"
+        console.log_raw(f"{label}: {formatted_size:.2f} {fmt.upper()}", level=console.DEBUG)
 
     @classmethod
     def register_subcommands(cls, main_command: click.Command):
@@ -155,6 +217,7 @@ class LogsCommand:
                 "callback": cls.get_logs_size,
                 "params": [
                     click.Option(('-f', "--fmt"), type=str, default="kb", help="Size unit: b, kb, mb, gb."),
+                    click.Option(("-fs", "--use-statvfs"), is_flag=True, default=False, help="Report used space of the whole filesystem holding the logs (single syscall)."),
                 ],
                 "help": "Get the total size of logs."
             },
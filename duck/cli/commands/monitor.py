@@ -7,16 +7,20 @@ New features:
 - History length is configurable (default 8 samples)
 """
 import os
+import re
 import time
 import psutil
 import fnmatch
 import platform
 
+from collections import deque
 from typing import (
     Optional,
     List,
     Dict,
     Any,
+    Callable,
+    Tuple,
 )
 
 from rich import box
@@ -30,6 +34,83 @@ from duck.utils.platform import is_phone
 
 console = Console()
 
+MB = 1 << 20
+GB = 1 << 30
+
+
+class MetricHistory:
+    """
+    Fixed-length rolling window of samples for a single metric.
+    
+    Min, max and average are maintained incrementally as samples are appended,
+    using a running sum and a pair of monotonic deques, so reading them is O(1)
+    instead of a full reduction over the window on every frame.
+    
+    Notes:
+    - Non-numeric samples (e.g. "N/A") are kept for display but count as 0.0 in the stats.
+    """
+    
+    def __init__(self, maxlen: int):
+        self.maxlen = max(1, int(maxlen))
+        self.values = deque(maxlen=self.maxlen)
+        self.total = 0.0
+        
+        # Monotonic deques of (index, value), fronts hold the current min/max.
+        self._min = deque()
+        self._max = deque()
+        self._numeric = deque(maxlen=self.maxlen)
+        self._index = 0
+        
+    def append(self, value: Any):
+        """
+        Append a sample, evicting the oldest one once the window is full.
+        """
+        num = value if isinstance(value, (int, float)) else 0.0
+        
+        if len(self.values) == self.maxlen:
+            self.total -= self._numeric[0]
+            
+        self.values.append(value)
+        self._numeric.append(num)
+        self.total += num
+        
+        idx = self._index
+        self._index += 1
+        expired = idx - self.maxlen
+        
+        while self._min and self._min[-1][1] >= num:
+            self._min.pop()
+        self._min.append((idx, num))
+        
+        while self._max and self._max[-1][1] <= num:
+            self._max.pop()
+        self._max.append((idx, num))
+        
+        # Drop samples which have left the window
+        if self._min[0][0] <= expired:
+            self._min.popleft()
+        if self._max[0][0] <= expired:
+            self._max.popleft()
+            
+    def __len__(self) -> int:
+        return len(self.values)
+        
+    @property
+    def min(self) -> float:
+        return self._min[0][1]
+        
+    @property
+    def max(self) -> float:
+        return self._max[0][1]
+        
+    @property
+    def avg(self) -> float:
+        return self.total / len(self.values)
+        
+    @property
+    def current(self) -> Any:
+        return self.values[-1]
+
 
 class MonitorCommand:
     """
@@ -40,22 +121,40 @@ class MonitorCommand:
     - Visuals table below process tables with sparklines, min/max/avg/current
     - History length is configurable (default 30 samples)
     """
+    
+    PROC_RESCAN_FRAMES: int = 10
+    """
+    Number of frames between full process table scans, in between only the cached matching processes are refreshed.
+    """
+    
+    _proc_cache: Dict[int, psutil.Process] = {}
+    _proc_filter: Optional[tuple] = None
+    _proc_pattern: Optional[re.Pattern] = None
+    _proc_scan_frame: int = 0
+    _root_path: Optional[str] = None
+    _trend_bars: Dict[Tuple[int, str], Text] = {}
+    _core_prefixes: List[str] = []
 
     SPARK_SYMBOLS = "▁▂▃▄▅▆▇█"
     
+    # Prebuilt one-char strings, indexing a str with non-latin-1 chars allocates a new string each time.
+    _spark_chars: Tuple[str, ...] = tuple(SPARK_SYMBOLS)
+    
     @classmethod
-    def disk(cls):
+    def get_root_path(cls) -> str:
         """
-        Return root disk usage in GB as a dictionary:
-        {'root': str, 'used': float, 'total': float, 'free': float, 'percent': float}
+        Return the root path to report disk usage for, resolved once per process.
         """
+        if cls._root_path is not None:
+            return cls._root_path
+            
         # Determine root path depending on OS
         system = platform.system().lower()
         
         if "windows" in system:
             root_path = os.environ.get("SystemDrive", "C:\\")
         
-        if is_phone():
+        elif is_phone():
             root_path = "/storage/emulated/0"
             
             if "ios" in system:
@@ -63,15 +162,26 @@ class MonitorCommand:
             
         else:
             root_path = "/"
+            
+        cls._root_path = root_path
+        return root_path
+        
+    @classmethod
+    def disk(cls):
+        """
+        Return root disk usage in GB as a dictionary:
+        {'root': str, 'used': float, 'total': float, 'free': float, 'percent': float}
+        """
+        root_path = cls.get_root_path()
         
         # Get disk usage
         usage = psutil.disk_usage(root_path)
         
         return {
             "root": root_path,
-            "used": usage.used / (1024 ** 3),
-            "total": usage.total / (1024 ** 3),
-            "free": usage.free / (1024 ** 3),
+            "used": usage.used / GB,
+            "total": usage.total / GB,
+            "free": usage.free / GB,
             "percent": usage.percent
         }
         
@@ -79,6 +189,9 @@ class MonitorCommand:
     def render_trend_bar(cls, value: float, max_value: float = 100) -> Text:
         """
         Return a slim unicode trend block with color based on value.
+        
+        Notes:
+        - Bars are built once per (level, color) and shared, do not modify the returned `Text`.
         """
         symbols = "▏▎▍▌▋▊▉█"
         
@@ -87,17 +200,22 @@ class MonitorCommand:
         except Exception:
             level = 0
         
-        bar = Text(symbols[level])
-        
         if value >= 80:
-            bar.stylize("bold red")
+            style = "bold red"
         
         elif value >= 70:
-            bar.stylize("yellow")
+            style = "yellow"
         
         else:
-            bar.stylize("green")
+            style = "green"
+            
+        key = (level, style)
+        bar = cls._trend_bars.get(key)
         
+        if bar is None:
+            bar = Text(symbols[level])
+            bar.stylize(style)
+            cls._trend_bars[key] = bar
         return bar
 
     @classmethod
@@ -108,19 +226,27 @@ class MonitorCommand:
         if not values:
             return "N/A"
         
-        symbols = cls.SPARK_SYMBOLS
+        symbols = cls._spark_chars
         mx = max_value if max_value and max_value > 0 else max(values) or 1.0
         
         # optionally trim/scale to width
-        vals = values if (width is None or len(values) <= width) else values[-width:]
+        vals = values if (width is None or len(values) <= width) else list(values)[-width:]
+        top = len(symbols) - 1
+        
+        try:
+            # Fast path, all values are numbers.
+            return "".join([symbols[max(0, min(int((v / mx) * top), top))] for v in vals])
+        except Exception:
+            pass
+            
         chars = []
         
         for v in vals:
             try:
-                idx = int((v / mx) * (len(symbols) - 1))
+                idx = int((v / mx) * top)
             except Exception:
                 idx = 0
-            idx = max(0, min(idx, len(symbols) - 1))
+            idx = max(0, min(idx, top))
             chars.append(symbols[idx])
         return "".join(chars)
 
@@ -138,23 +264,44 @@ class MonitorCommand:
         - name='duck*' matches 'duck', 'duck_server', etc.
         - name='*server*' matches any process containing 'server'.
         """
+        proc_filter = (name.lower(), tuple(pids or ()))
+        
+        if proc_filter != cls._proc_filter or cls._proc_scan_frame % cls.PROC_RESCAN_FRAMES == 0:
+            # Full scan, wildcard matching only happens here.
+            cache = {}
+            
+            if proc_filter != cls._proc_filter:
+                # Compile the wildcard once per filter rather than per process.
+                cls._proc_pattern = re.compile(fnmatch.translate(proc_filter[0]))
+            match = cls._proc_pattern.match
+            
+            for proc in psutil.process_iter(['pid', 'name']):
+                try:
+                    pid = proc.info['pid']
+                    proc_name = (proc.info.get('name') or "").lower()
+                    
+                    if (pids and pid in pids) or match(proc_name) is not None:
+                        # Keep the existing object so cpu_percent keeps its baseline
+                        cached = cls._proc_cache.get(pid)
+                        cache[pid] = cached if cached is not None and cached == proc else proc
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+                    
+            cls._proc_cache = cache
+            cls._proc_filter = proc_filter
+            cls._proc_scan_frame = 0
+            
+        cls._proc_scan_frame += 1
         processes = []
         
-        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'num_threads']):
+        for pid, proc in list(cls._proc_cache.items()):
             try:
-                # Filter by PID if given
-                if pids and proc.info['pid'] in pids:
-                    if proc not in processes:
-                        processes.append(proc)
-                        continue
-
-                # Wildcard matching for name
-                proc_name = (proc.info.get('name') or "").lower()
-                if fnmatch.fnmatch(proc_name, name.lower()):
-                    if proc not in processes:
-                        processes.append(proc)
+                if not proc.is_running():
+                    raise psutil.NoSuchProcess(pid)
+                proc.info = proc.as_dict(['pid', 'name', 'cpu_percent', 'memory_percent', 'num_threads'], ad_value=0)
+                processes.append(proc)
             except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
+                cls._proc_cache.pop(pid, None)
 
         # Sort processes by CPU or RAM
         if sort_by == "cpu":
@@ -170,8 +317,9 @@ class MonitorCommand:
         """
         # CPU
         try:
-            cpu_total = psutil.cpu_percent(interval=None)
+            # One /proc/stat read, the total is the mean of the cores
             cpu_per_core = psutil.cpu_percent(interval=None, percpu=True)
+            cpu_total = sum(cpu_per_core) / len(cpu_per_core) if cpu_per_core else 0.0
         except Exception:
             cpu_total, cpu_per_core = 0.0, []
 
@@ -179,18 +327,21 @@ class MonitorCommand:
         try:
             mem = psutil.virtual_memory()
             ram_percent = mem.percent
-            ram_used = mem.used // (1024**2)
-            ram_total = mem.total // (1024**2)
+            ram_used = mem.used // MB
+            ram_total = mem.total // MB
         except Exception:
             ram_percent, ram_used, ram_total = 0.0, 0, 1
 
+        # Bytes delta to MB/s
+        per_mb_second = 1.0 / (elapsed * MB)
+        
         # Disk
         try:
             disk = cls.disk()
             if prev_disk:
                 disk_io = psutil.disk_io_counters()
-                read_speed = (disk_io.read_bytes - prev_disk.read_bytes) / elapsed / (1024**2)
-                write_speed = (disk_io.write_bytes - prev_disk.write_bytes) / elapsed / (1024**2)
+                read_speed = (disk_io.read_bytes - prev_disk.read_bytes) * per_mb_second
+                write_speed = (disk_io.write_bytes - prev_disk.write_bytes) * per_mb_second
                 prev_disk = disk_io
             else:
                 read_speed = write_speed = 0.0
@@ -202,8 +353,8 @@ class MonitorCommand:
         try:
             if prev_net:
                 net_io = psutil.net_io_counters()
-                net_up = (net_io.bytes_sent - prev_net.bytes_sent) / elapsed / (1024**2)
-                net_down = (net_io.bytes_recv - prev_net.bytes_recv) / elapsed / (1024**2)
+                net_up = (net_io.bytes_sent - prev_net.bytes_sent) * per_mb_second
+                net_down = (net_io.bytes_recv - prev_net.bytes_recv) * per_mb_second
                 prev_net = net_io
             else:
                 net_up = net_down = 0.0
@@ -225,7 +376,23 @@ class MonitorCommand:
         table.add_column("Disk", style="green")
         table.add_column("Network", style="blue")
 
-        cpu_str = "\n".join([f"Core {i}: {v:.1f}% {cls.render_trend_bar(v)}" for i, v in enumerate(cpu_per_core)]) if cpu_per_core else "N/A"
+        if cpu_per_core:
+            prefixes = cls._core_prefixes
+            
+            if len(prefixes) < len(cpu_per_core):
+                prefixes = cls._core_prefixes = [f"Core {i}: " for i in range(len(cpu_per_core))]
+            
+            # Append the bars as Text so their colors survive
+            cpu_str = Text()
+            
+            for i, (prefix, v) in enumerate(zip(prefixes, cpu_per_core)):
+                if i:
+                    cpu_str.append("\n")
+                cpu_str.append(f"{prefix}{v:.1f}% ")
+                cpu_str.append(cls.render_trend_bar(v))
+        else:
+            cpu_str = "N/A"
+            
         table.add_row(cpu_str, ram_str, disk_str, net_str)
         return table
 
@@ -259,27 +426,35 @@ class MonitorCommand:
         table_io.add_column("Net ⇑ (MB)", justify="center", style="yellow")
         table_io.add_column("Net ⇓ (MB)", justify="center", style="blue")
 
+        def metric(info: Dict[str, Any], key: str, getter: Callable[[], Any]) -> Any:
+            # Only query the process for values not already fetched
+            value = info.get(key)
+            return getter() if value is None else value
+            
         for idx, proc in enumerate(processes[:10]):
             try:
                 style = "bold bright_white" if idx < 3 else None
+                info = getattr(proc, "info", None) or {}
                 
-                # Main metrics
-                table_main.add_row(
-                    str(proc.pid),
-                    proc.name(),
-                    f"{proc.info.get('cpu_percent', proc.cpu_percent()):.1f}%",
-                    f"{proc.info.get('memory_percent', proc.memory_percent()):.2f}%",
-                    str(proc.info.get('num_threads', proc.num_threads())),
-                    style=style
-                )
-                
-                # Per-process IO
-                try:
-                    io_counters = proc.io_counters()
-                    read_mb = f"{io_counters.read_bytes / 1024**2:.2f}"
-                    write_mb = f"{io_counters.write_bytes / 1024**2:.2f}"
-                except Exception:
-                    read_mb = write_mb = "N/A"
+                # Coalesce the /proc reads below into a single pass per process
+                with proc.oneshot():
+                    # Main metrics
+                    table_main.add_row(
+                        str(proc.pid),
+                        metric(info, 'name', proc.name),
+                        f"{metric(info, 'cpu_percent', proc.cpu_percent):.1f}%",
+                        f"{metric(info, 'memory_percent', proc.memory_percent):.2f}%",
+                        str(metric(info, 'num_threads', proc.num_threads)),
+                        style=style
+                    )
+                    
+                    # Per-process IO
+                    try:
+                        io_counters = proc.io_counters()
+                        read_mb = f"{io_counters.read_bytes / MB:.2f}"
+                        write_mb = f"{io_counters.write_bytes / MB:.2f}"
+                    except Exception:
+                        read_mb = write_mb = "N/A"
 
                 # Optional: per-process network (N/A if not available)
                 # Per-process net io counters not available.
@@ -294,10 +469,10 @@ class MonitorCommand:
         return table_main, table_io
 
     @classmethod
-    def make_history_table(cls, history: List[Dict[str, Any]], cpu_warning: float, ram_warning: float, width: int = 30):
+    def make_history_table(cls, history: Dict[str, MetricHistory], cpu_warning: float, ram_warning: float, width: int = 30):
         """
         Build a visuals/history table showing sparklines and summary stats.
-        history: list of dict entries with keys 'cpu', 'ram', 'disk', 'net_up', 'net_down'
+        history: mapping of 'cpu', 'ram', 'disk', 'net_up', 'net_down' to their MetricHistory
         """
         tbl = Table(title="📈 Visuals (History)", expand=True, box=box.SIMPLE_HEAVY, padding=(0, 1))
         tbl.add_column("Metric", style="bold")
@@ -306,38 +481,45 @@ class MonitorCommand:
         tbl.add_column("Avg", justify="center")
         tbl.add_column("Max", justify="center")
         tbl.add_column("Current", justify="center")
-
-        # helper to extract series
-        def series(key: str) -> List[float]:
-            return [entry.get(key, 0.0) for entry in history]
-
+        
+        def net_max(key: str) -> float:
+            # Same as max((v or 1.0) for v in window): zero samples count as 1.0,
+            # so the floor only applies while the window holds a zero (rates are never negative).
+            series = history.get(key)
+            
+            if not series:
+                return 1.0
+            return max(series.max, 1.0) if series.min == 0 else series.max
+            
         metrics = [
             ("CPU %", "cpu", 100.0, cpu_warning),
             ("RAM %", "ram", 100.0, ram_warning),
             ("Disk %", "disk", 100.0, None),
-            ("Net Up mb/s", "net_up", max((h.get("net_up") or 1.0) for h in history) if history else 1.0, None),
-            ("Net Down mb/s", "net_down", max((h.get("net_down") or 1.0) for h in history) if history else 1.0, None),
+            ("Net Up mb/s", "net_up", net_max("net_up"), None),
+            ("Net Down mb/s", "net_down", net_max("net_down"), None),
         ]
 
         for label, key, max_v, warn in metrics:
-            vals = series(key)
+            series = history.get(key)
+            vals = series.values if series else ()
             if not vals:
                 hist = "N/A"
                 mn = av = mx = cur = "N/A"
             else:
                 hist = cls.sparkline_from_values(vals, max_value=max_v, width=width)
-                mn = f"{min(vals):.2f}"
-                av = f"{(sum(vals) / len(vals)):.2f}"
-                mx = f"{max(vals):.2f}"
-                cur = f"{vals[-1]:.2f}"
+                mn = f"{series.min:.2f}"
+                av = f"{series.avg:.2f}"
+                mx = f"{series.max:.2f}"
+                cur = series.current
+                cur = f"{cur:.2f}" if isinstance(cur, (int, float)) else str(cur)
 
             # color current if above warning thresholds
             cur_text = Text(cur)
             if warn is not None and vals:
                 try:
-                    if float(vals[-1]) >= warn:
+                    if float(series.current) >= warn:
                         cur_text.stylize("bold red")
-                    elif float(vals[-1]) >= warn * 0.85:
+                    elif float(series.current) >= warn * 0.85:
                         cur_text.stylize("yellow")
                     else:
                         cur_text.stylize("green")
@@ -408,9 +590,18 @@ class MonitorCommand:
         except Exception:
             prev_net = None
 
-        history: List[Dict[str, float]] = []
+        history: Dict[str, MetricHistory] = {
+            key: MetricHistory(history_length)
+            for key in ("cpu", "ram", "disk", "net_up", "net_down")
+        }
 
-        with Live(console=console, refresh_per_second=4, screen=True) as live:
+        # Spacers are static, build them once rather than every frame
+        spacer = Text("\n")
+        empty = Text("")
+        
+        # Render only when a new sample is in, instead of redrawing the unchanged
+        # tables several times per interval.
+        with Live(console=console, auto_refresh=False, screen=True) as live:
             while True:
                 now = time.time()
                 elapsed = max(0.0001, now - prev_time)
@@ -422,16 +613,14 @@ class MonitorCommand:
                  net_up, net_down, prev_disk, prev_net) = cls.get_system_metrics(prev_disk, prev_net, elapsed)
 
                 # Append to history (rolling buffer)
-                history.append({
-                    "cpu": cpu_total,
-                    "ram": ram_percent,
-                    "disk": disk_percent,
-                    "net_up": net_up,
-                    "net_down": net_down
-                })
-                
-                if len(history) > history_length:
-                    history.pop(0)
+                for key, value in (
+                    ("cpu", cpu_total),
+                    ("ram", ram_percent),
+                    ("disk", disk_percent),
+                    ("net_up", net_up),
+                    ("net_down", net_down),
+                ):
+                    history[key].append(value)
 
                 # Apply warning coloring
                 ram_style = "red" if ram_percent >= ram_warning else "magenta"
@@ -473,13 +662,13 @@ class MonitorCommand:
                 # Compose everything and update once to avoid flicker
                 group = Group(
                     sys_table,
-                    Text("\n"),
+                    spacer,
                     proc_main,
-                    Text("\n"),
-                    proc_io if proc_io else Text(""),
-                    Text("\n"),
+                    spacer,
+                    proc_io if proc_io else empty,
+                    spacer,
                     hist_table
                 )
 
-                live.update(group)
+                live.update(group, refresh=True)
                 time.sleep(interval)
@@ -33,7 +33,10 @@ class RuntestsCommand:
         if verbose:
             os.environ["DUCK_TESTS_VERBOSE"] = "true"
             
-        subprocess.call([
+        # Run in a fresh interpreter, settings may already be loaded in this one (e.g. through
+        # duck.logging.console) and the testing settings module must be the one in effect.
+        returncode = subprocess.call([
             sys.executable, "-m", "unittest", "discover", "-s",
             tests_dir, "-p", "test_*.py", "-t", tests_dir,
         ])
+        sys.exit(returncode)
@@ -76,9 +76,11 @@ class SitemapCommand:
                 default_changefreq=frequency,
                 apply_default_excludes=apply_default_excludes,
             )
-            xml = builder.build()
+            # The sitemap is only built in memory if it has to be shown, otherwise it is streamed to file.
+            xml = builder.build(return_content=view)
+            
             if save:
-                    console.log(f"Sitemap saved at {filepath}\n", level=console.SUCCESS)
+                console.log(f"Sitemap saved at {filepath}\n", level=console.SUCCESS)
             if view:
                 console.log_raw(xml)
         except Exception as e:
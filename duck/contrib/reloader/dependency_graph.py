@@ -72,18 +72,19 @@ Key Concepts:
 6. Notes:
    - Always initialize DependencyGraph before any other imports to capture runtime imports.
    - Supports lazy updates: only rebuild for changed files, not the whole project.
-   - Leaf-first reload order ensures safe reloading of dependencies.
+   - Reload order is topological (imports before importers), so dependencies are reloaded first.
    - Runtime imports captured automatically; manual additions possible via add_runtime_dependency().
 
 ---
 
 Author: Brian Musakwa
 """
+import os
 import ast
 import sys
+import heapq
 import types
 import builtins
-import inspect
 
 from pathlib import Path
 from collections import defaultdict, deque
@@ -94,6 +95,11 @@ class DependencyGraph:
     Tracks module dependencies (static and runtime) and provides
     methods to determine safe reload order for affected modules.
     """
+    
+    STATEMENT_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+    """
+    AST node fields holding nested statements, e.g. function/class bodies, `else`, `except` & `match` blocks.
+    """
 
     def __init__(self, project_root: str = "."):
         """
@@ -105,6 +111,7 @@ class DependencyGraph:
         self.project_root = Path(project_root).resolve()
         self.reverse_graph = defaultdict(set)  # module -> set of dependents
         self.runtime_imports = set()  # modules imported dynamically
+        self.file_imports_cache = {}  # file path -> (mtime_ns, size, imports)
 
         # Patch built-in import to track runtime imports
         self._original_import = builtins.__import__
@@ -122,14 +129,12 @@ class DependencyGraph:
         if isinstance(module, types.ModuleType):
             self.runtime_imports.add(module.__name__)
 
-            # Identify the module performing the import
-            frame = inspect.currentframe()
-            try:
-                caller_module = inspect.getmodule(frame.f_back)
-                if caller_module:
-                    self.reverse_graph[module.__name__].add(caller_module.__name__)
-            finally:
-                del frame
+            # Identify the module performing the import, reading the caller's globals
+            # is much cheaper than resolving its module with `inspect.getmodule`.
+            caller_name = sys._getframe(1).f_globals.get("__name__")
+            
+            if caller_name:
+                self.reverse_graph[module.__name__].add(caller_name)
 
         return module
         
@@ -158,25 +163,30 @@ class DependencyGraph:
         Returns:
             set: Names of imported modules.
         """
-        tree = ast.parse(source)
         imports = set()
-
-        class ImportVisitor(ast.NodeVisitor):
-            def visit_Import(self, node):
-                for n in node.names:
-                    imports.add(n.name)
-
-            def visit_ImportFrom(self, node):
-                if node.module:
-                    imports.add(node.module)
-
-            def visit_FunctionDef(self, node):
-                self.generic_visit(node)
-
-            def visit_ClassDef(self, node):
-                self.generic_visit(node)
-
-        ImportVisitor().visit(tree)
+        
+        if "import" not in source:
+            return imports
+            
+        # Imports are statements, so only statement lists are walked, skipping
+        # expression nodes which make up most of the tree.
+        stack = [ast.parse(source)]
+        
+        while stack:
+            node = stack.pop()
+            
+            for field in DependencyGraph.STATEMENT_FIELDS:
+                for child in getattr(node, field, ()):
+                    if isinstance(child, ast.Import):
+                        for n in child.names:
+                            imports.add(n.name)
+                            
+                    elif isinstance(child, ast.ImportFrom):
+                        if child.module:
+                            imports.add(child.module)
+                    
+                    else:
+                        stack.append(child)
         return imports
         
     def build_graph_for_file(self, file_path: str) -> tuple[dict, str]:
@@ -191,12 +201,27 @@ class DependencyGraph:
                               Current module name
         """
         module_name = self.module_name_from_path(file_path)
+        
         try:
-            source = Path(file_path).read_text()
-        except Exception:
+            stat = os.stat(file_path)
+        except OSError:
             return {}, module_name  # Could not read file
-
-        imports = self.parse_imports(source)
+        
+        # Files which haven't changed since they were last parsed are not parsed again
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self.file_imports_cache.get(file_path)
+        
+        if cached and cached[:2] == key:
+            imports = cached[2]
+        else:
+            try:
+                source = Path(file_path).read_text()
+            except Exception:
+                return {}, module_name  # Could not read file
+                
+            imports = frozenset(self.parse_imports(source))
+            self.file_imports_cache[file_path] = (*key, imports)
+            
         local_graph = {imp: set([module_name]) for imp in imports}
         return local_graph, module_name
 
@@ -213,7 +238,7 @@ class DependencyGraph:
     def get_modules_to_reload(self, changed_module: str) -> list[str]:
         """
         Return a list of modules affected by a changed module,
-        in safe reload order (leaf-first).
+        in safe reload order (dependencies before their dependents).
 
         Args:
             changed_module (str): Module that has changed.
@@ -221,19 +246,45 @@ class DependencyGraph:
         Returns:
             list[str]: Modules to reload in order.
         """
-        affected = set()
+        affected = {changed_module}
         queue = deque([changed_module])
 
         while queue:
             mod = queue.popleft()
-            if mod in affected:
-                continue
-            affected.add(mod)
-            for dependent in self.reverse_graph.get(mod, []):
-                queue.append(dependent)
-
-        # Leaf-first order: modules with fewer dots first
-        return sorted(affected, key=lambda x: len(x.split(".")))
+            for dependent in self.reverse_graph.get(mod, ()):
+                if dependent not in affected:
+                    affected.add(dependent)
+                    queue.append(dependent)
+        
+        # Topological order (Kahn's algorithm), a module is reloaded only after the affected modules it imports.
+        in_degree = dict.fromkeys(affected, 0)
+        
+        for mod in affected:
+            for dependent in self.reverse_graph.get(mod, ()):
+                if dependent != mod:
+                    in_degree[dependent] += 1
+        
+        # Ties are broken by the number of dots (shallower modules first), then by name.
+        ready = [(mod.count("."), mod) for mod, degree in in_degree.items() if degree == 0]
+        heapq.heapify(ready)
+        order = []
+        
+        while ready:
+            _, mod = heapq.heappop(ready)
+            order.append(mod)
+            
+            for dependent in self.reverse_graph.get(mod, ()):
+                if dependent == mod:
+                    continue
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    heapq.heappush(ready, (dependent.count("."), dependent))
+                    
+        if len(order) < len(affected):
+            # Import cycles, append the remaining modules using the dot count heuristic.
+            remaining = affected.difference(order)
+            order.extend(sorted(remaining, key=lambda x: (x.count("."), x)))
+        return order
         
     def add_runtime_dependency(self, module_name: str, imported_module: str):
         """
@@ -5,6 +5,8 @@ Watches for file changes in Duck framework projects and restarts the
 webserver in DEBUG mode whenever relevant `.py` files change.
 
 """
+import os
+import re
 import sys
 import time
 import fnmatch
@@ -70,40 +72,66 @@ class Handler(FileSystemEventHandler):
     """
     Handles filesystem events and triggers debounced full server reloads.
     """
+    RELOAD_EVENT_TYPES = frozenset({"created", "modified", "deleted", "moved"})
+    """
+    Filesystem event types which trigger a reload.
+    """
+    
     def __init__(self, debounce_interval=0.6):
         super().__init__()
         self.debounce_interval = debounce_interval
-        self.restart_timer = None
         self.latest_event = None
+        self.restart_deadline = 0.0
+        self.restart_requested = threading.Event()
+        self.debounce_thread = None
         self.restarting = threading.Lock()
         self.last_restart_time = 0
+        
+        # Combine watch patterns into one regex, normcase is applied like in `fnmatch.fnmatch`.
+        watch_files = SETTINGS["AUTO_RELOAD_WATCH_FILES"]
+        self.watch_files_match = re.compile(
+            "|".join(fnmatch.translate(os.path.normcase(pat)) for pat in watch_files)
+        ).match if watch_files else None
 
     def on_any_event(self, event):
         """
         Called on any filesystem event; filters `.py` files and schedules reload.
         """
-        watch_files = SETTINGS["AUTO_RELOAD_WATCH_FILES"]
-        
         if event.is_directory:
             return
         
-        if not any(fnmatch.fnmatch(event.src_path, pat) for pat in watch_files):
+        if not self.watch_files_match or not self.watch_files_match(os.path.normcase(event.src_path)):
             return
 
-        if event.event_type not in {"created", "modified", "deleted", "moved"}:
+        if event.event_type not in self.RELOAD_EVENT_TYPES:
             # Ignore event.
             return
         
-        # Update the latest event    
+        # Update the latest event and push back the restart deadline
         self.latest_event = event
+        self.restart_deadline = time.monotonic() + self.debounce_interval
         
-        if self.restart_timer:
-            self.restart_timer.cancel()
-        
-        # Set & start the timer
-        self.restart_timer = threading.Timer(self.debounce_interval, self._trigger_restart)
-        self.restart_timer.start()
+        if self.debounce_thread is None:
+            # A single long-lived thread debounces events, rather than a new timer thread per event.
+            self.debounce_thread = threading.Thread(target=self._debounce_loop, name="ducksight-debounce", daemon=True)
+            self.debounce_thread.start()
+            
+        self.restart_requested.set()
         
+    def _debounce_loop(self):
+        """
+        Waits for events and triggers a restart once no new event has arrived for `debounce_interval` seconds.
+        """
+        while True:
+            self.restart_requested.wait()
+            
+            # Events arriving meanwhile move the deadline further.
+            while (remaining := self.restart_deadline - time.monotonic()) > 0:
+                time.sleep(remaining)
+                
+            self.restart_requested.clear()
+            self._trigger_restart()
+            
     def restart_webserver(self, changed_file: str):
         """
         Perform the actual server reload.
@@ -130,9 +158,25 @@ class Handler(FileSystemEventHandler):
             """
             This restarts the application.
             """
+            argv = list(sys.argv)
+            
+            if "--is-reload" not in argv:
+                argv.append("--is-reload")
+                
             # Was started from a file
-            cmd = [sys.executable, *sys.argv, "--is-reload"]
-            subprocess.run(cmd)
+            cmd = [sys.executable, *argv]
+            
+            if platform.system().lower() == "windows":
+                # os.exec* is emulated on Windows by spawning a new process and exiting,
+                # which detaches the console, run the reloaded app as a child instead.
+                subprocess.run(cmd)
+                return
+                
+            # Replace the current process image, this avoids copying the memory of this
+            # process into a child which would then have to wait on it forever.
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.execv(sys.executable, cmd)
             
         try:
             restart_app()
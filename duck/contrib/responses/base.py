@@ -7,7 +7,8 @@ themed HTML responses using Duck's internal template engine.
 
 import os
 
-from typing import Type, Optional, Dict, Any
+from functools import lru_cache
+from typing import Type, Optional, Dict, Any, Tuple
 
 from duck.etc.internals.template import internal_render, async_internal_render
 from duck.http.response import HttpResponse, TemplateResponse
@@ -23,6 +24,25 @@ DEFAULT_FAVICON = (
 )
 
 
+@lru_cache(maxsize=None)
+def get_status_info(response_class: Type[HttpResponse]) -> Tuple[int, str, str]:
+    """
+    Returns the status code, status message and status explanation of a response class.
+    
+    The response class is validated and instantiated only once, results are cached per class.
+
+    Raises:
+        TypeError: If response_class is not a subclass of HttpResponse.
+    """
+    if not issubclass(response_class, HttpResponse):
+        raise TypeError(
+            f"{response_class.__name__} must be a subclass of HttpResponse."
+        )
+        
+    response = response_class()
+    return response.status_code, response.status_message, response.status_explanation
+    
+
 def make_response(
     response_class: Type[HttpResponse],
     title: str = None,
@@ -65,30 +85,23 @@ def make_response(
         TypeError: If icon_link is provided without icon_type.
     """
 
-    # Validate response class before doing any work.
-    if not issubclass(response_class, HttpResponse):
-        raise TypeError(
-            f"{response_class.__name__} must be a subclass of HttpResponse."
-        )
+    # Validate response class and read status metadata off the class (cached per class).
+    default_status_code, status_message, status_explanation = get_status_info(response_class)
 
     # icon_type is required whenever a custom icon is supplied.
     if icon_link and not icon_type:
         raise TypeError("icon_type must be provided when icon_link is set.")
 
-    # Instantiate to read status metadata off the class.
-    response = response_class()
-
     # Resolve body first so we can stash it for later retrieval.
-    resolved_body = mark_safe(body or response.status_explanation)
-    response._body = resolved_body
+    resolved_body = mark_safe(body or status_explanation)
 
     # Build the template context, inferring any omitted values.
     context = {
-        "title": title or response.status_message,
-        "heading": heading or response.status_message,
+        "title": title or status_message,
+        "heading": heading or status_message,
         "body": resolved_body,
-        "status_code":  status_code or response.status_code,
-        "status_label": status_label or response.status_message,
+        "status_code":  status_code or default_status_code,
+        "status_label": status_label or status_message,
         "icon_link": icon_link,
         "icon_type": icon_type,
         "debug": debug if debug is not None else SETTINGS["DEBUG"],
@@ -101,7 +114,7 @@ def make_response(
         template=template or "base.html",
         context=context,
         content_type="text/html",
-        status_code=response.status_code,
+        status_code=default_status_code,
     )
 
     # Preserve the resolved body on the rendered response for downstream use.
@@ -153,29 +166,22 @@ async def async_make_response(
         TypeError: If icon_link is provided without icon_type.
     """
 
-    # Validate before any work is done.
-    if not issubclass(response_class, HttpResponse):
-        raise TypeError(
-            f"{response_class.__name__} must be a subclass of HttpResponse."
-        )
+    # Validate and read status metadata (cached per class).
+    default_status_code, status_message, status_explanation = get_status_info(response_class)
 
     if icon_link and not icon_type:
         raise TypeError("icon_type must be provided when icon_link is set.")
 
-    # Instantiate to read status metadata.
-    response = response_class()
-
-    # Resolve and stash body for downstream retrieval.
-    resolved_body = mark_safe(body or response.status_explanation)
-    response._body = resolved_body
+    # Resolve body for downstream retrieval.
+    resolved_body = mark_safe(body or status_explanation)
 
     # Build template context.
     context = {
-        "title": title or response.status_message,
-        "heading": heading or response.status_message,
+        "title": title or status_message,
+        "heading": heading or status_message,
         "body": resolved_body,
-        "status_code": status_code or response.status_code,
-        "status_label": status_label or response.status_message,
+        "status_code": status_code or default_status_code,
+        "status_label": status_label or status_message,
         "icon_link": icon_link,
         "icon_type": icon_type,
         "debug": debug if debug is not None else SETTINGS["DEBUG"],
@@ -188,7 +194,7 @@ async def async_make_response(
         template=template or "base.html",
         context=context,
         content_type="text/html",
-        status_code=response.status_code,
+        status_code=default_status_code,
     )
 
     # Preserve resolved body on the rendered response.
@@ -26,7 +26,9 @@ from datetime import date
 from pathlib import Path
 from urllib.parse import quote
 from typing import (
+    IO,
     Iterable,
+    Iterator,
     List,
     Optional,
     Set,
@@ -325,16 +327,15 @@ class SitemapBuilder:
 
         return to_component(tag="url", children=children)
 
-    def build(self, return_content: bool = True) -> Optional[str]:
+    def iter_xml(self) -> Iterator[str]:
         """
-        Build the sitemap XML.
-
-        Args:
-            return_content: If True, return the sitemap XML as a string. If False,
-                return None (but still save to file if configured).
+        Generate the sitemap XML in chunks, one chunk per <url> element.
+        
+        Rendering the <urlset> is the same as rendering its children one after another
+        between the opening and closing tags, so the document never has to be held in memory at once.
 
-        Returns:
-            The sitemap XML string when `return_content` is True, otherwise None.
+        Yields:
+            str: Consecutive chunks of the sitemap XML.
         """
         registered_urls = self._collect_registered_urls()
         seen = {str(u) for u in registered_urls}
@@ -344,26 +345,53 @@ class SitemapBuilder:
 
         sitemap_ns = "http://www.sitemaps.org/schemas/sitemap/0.9"
         today_iso = date.today().isoformat()
-
-        url_nodes = []
+        
+        yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+        yield f'<urlset xmlns="{sitemap_ns}">'
+        
         for u in candidates:
             node = self._build_url_component(u, lastmod_iso=today_iso, changefreq=self.default_changefreq, priority=self.default_priority)
-            url_nodes.append(node)
+            yield node.render()
+            
+        yield "</urlset>"
+        
+    def stream_to(self, fp: IO[str]) -> None:
+        """
+        Write the sitemap XML to a file-like object, chunk by chunk.
 
-        urlset = to_component(tag="urlset", children=url_nodes, props={"xmlns": sitemap_ns})
+        Args:
+            fp: Text file-like object to write to.
+        """
+        for chunk in self.iter_xml():
+            fp.write(chunk)
+            
+    def build(self, return_content: bool = True) -> Optional[str]:
+        """
+        Build the sitemap XML.
 
-        sitemap_body = urlset.render()
-        sitemap_xml = '<?xml version="1.0" encoding="UTF-8"?>\n' + sitemap_body
+        Args:
+            return_content: If True, return the sitemap XML as a string. If False,
+                return None (but still save to file if configured). The sitemap is streamed
+                to the file in this case, without building the whole document in memory.
 
-        if self.save_to_file:
-            filepath = self.filepath
+        Returns:
+            The sitemap XML string when `return_content` is True, otherwise None.
+        """
+        filepath = self.filepath
+        
+        if self.save_to_file and filepath is None:
+            raise TypeError("Filepath cannot be None if save_to_file=True.")
             
-            if filepath is None:
-                raise TypeError("Filepath cannot be None if save_to_file=True.")
-                
+        if not return_content:
+            if self.save_to_file:
+                with open(filepath, "w", encoding="utf-8", buffering=1 << 16) as fh:
+                    self.stream_to(fh)
+            return None
+            
+        sitemap_xml = "".join(self.iter_xml())
+        
+        if self.save_to_file:
             with open(filepath, "w", encoding="utf-8") as fh:
                 fh.write(sitemap_xml)
-
-        if return_content:
-            return sitemap_xml
-        return None
+                
+        return sitemap_xml
@@ -230,17 +230,15 @@ class BaseServer:
         
         # We were only using sock reuse in DEBUG but we are allowing it for both DEBUG and PRODUCTION for fast 
         # server restarts. 
+        # SO_REUSEPORT is deliberately not set, it would let unrelated processes bind the same port
+        # and silently share its traffic. Workers share the one listening socket bound below instead.
         self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         
-        if hasattr(socket, "SO_REUSEPORT"):
-            try:
-                self.sock.setsockopt(socket.SO_REUSEPORT, socket.SO_REUSEPORT, 1)
-            except OSError:
-                pass
-                
         # Bind and listen        
+        # Note: The socket is bound once here, worker threads/processes started below share this
+        # listening socket (and its accept queue) rather than binding their own.
         self.sock.bind(self.addr)  # bind socket to (address, port)
-        self.sock.listen(SETTINGS["REQUESTS_BACKLOG"]) # 200 by default
+        self.sock.listen(SETTINGS["REQUESTS_BACKLOG"]) # socket.SOMAXCONN by default
         
         # Prepare server setup
         duck_host = self.domain or Meta.get_metadata("DUCK_SERVER_HOST")
@@ -298,13 +296,10 @@ class BaseServer:
                 # Restart background workers
                 # Recreate managers recreates and attaches new managers fot the current 
                 # thread and all its descendents.
-                _async = SETTINGS['ASYNC_HANDLING']
-                start_bg_eventloop_if_wsgi = getattr(self.application, "start_bg_eventloop_if_wsgi", True)
-                
                 # This only restarts request handling threadpool/eventloop manager plus component threadpool manager
                 _async = SETTINGS['ASYNC_HANDLING']
-                start_bg_eventloop_if_wsgi = getattr(self, "start_bg_eventloop_if_wsgi", True)
-                start_eventloop = _async or (not _async and start_bg_eventloop_if_wsgi)
+                start_bg_eventloop_if_wsgi = getattr(self.application, "start_bg_eventloop_if_wsgi", True)
+                start_eventloop = _async or start_bg_eventloop_if_wsgi
                 
                 App.start_background_workers(
                     self,
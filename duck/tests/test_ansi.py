@@ -0,0 +1,70 @@
+"""
+Test cases for the ANSI escape code removal utilities.
+"""
+
+import unittest
+
+from duck.utils.ansi import (
+    remove_ansi_escape_codes,
+    remove_ansi_escape_codes_str,
+    remove_ansi_escape_codes_bytes,
+)
+
+
+class TestRemoveAnsiEscapeCodes(unittest.TestCase):
+    """
+    Test class for stripping ANSI escape codes from strings and bytes.
+    """
+
+    def test_str(self):
+        """
+        Test that color and reset codes are removed from a string.
+        """
+        self.assertEqual(remove_ansi_escape_codes_str("\x1b[1;31mred\x1b[0m text"), "red text")
+        self.assertEqual(remove_ansi_escape_codes_str("plain"), "plain")
+
+    def test_lines(self):
+        """
+        Test that codes are removed from every line, including lines containing newlines.
+        """
+        self.assertEqual(remove_ansi_escape_codes(["\x1b[32ma\x1b[0m", "b"]), ["a", "b"])
+        self.assertEqual(remove_ansi_escape_codes(("\x1b[32ma\nb\x1b[0m", "c")), ["a\nb", "c"])
+        self.assertEqual(remove_ansi_escape_codes([]), [])
+
+    def test_bytes(self):
+        """
+        Test that codes are removed from bytes and bytearrays, always returning bytes.
+        """
+        self.assertEqual(remove_ansi_escape_codes_bytes(b"\x1b[1mbold\x1b[0m"), b"bold")
+        self.assertEqual(remove_ansi_escape_codes_bytes(bytearray(b"\x1b[4mx\x1b[0m")), b"x")
+
+        result = remove_ansi_escape_codes_bytes(bytearray(b"plain"))
+        self.assertIs(type(result), bytes)
+        self.assertEqual(result, b"plain")
+
+    def test_bytes_matches_str(self):
+        """
+        Test that the bytes pattern strips exactly what the string pattern strips.
+        """
+        text = "\x1b[38;5;196mx\x1b[0m \x1b]y \x1b[?25lz"
+        self.assertEqual(
+            remove_ansi_escape_codes_bytes(text.encode()),
+            remove_ansi_escape_codes_str(text).encode(),
+        )
+
+    def test_invalid_types(self):
+        """
+        Test that non-string/non-bytes input raises TypeError.
+        """
+        with self.assertRaises(TypeError):
+            remove_ansi_escape_codes_bytes("not bytes")
+
+        with self.assertRaises(TypeError):
+            remove_ansi_escape_codes_str(b"not str")
+
+        with self.assertRaises(TypeError):
+            remove_ansi_escape_codes(["ok", 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Test cases for the reload ordering of the reloader's DependencyGraph.
+"""
+
+import unittest
+
+from duck.contrib.reloader.dependency_graph import DependencyGraph
+
+
+class TestDependencyGraphReloadOrder(unittest.TestCase):
+    """
+    Test class for `DependencyGraph.get_modules_to_reload`.
+    """
+
+    def setUp(self):
+        self.graph = DependencyGraph()
+
+        # DependencyGraph patches builtins.__import__, always restore it.
+        self.addCleanup(self.graph.stop)
+
+    def add_imports(self, module: str, *imported_modules: str):
+        for imported_module in imported_modules:
+            self.graph.add_runtime_dependency(module, imported_module)
+
+    def test_dependencies_before_dependents(self):
+        """
+        Test that every module is reloaded after the affected modules it imports.
+        """
+        self.add_imports("app.views", "app.models")
+        self.add_imports("app.urls", "app.views")
+        self.add_imports("web.main", "app.urls", "app.models")
+
+        order = self.graph.get_modules_to_reload("app.models")
+        self.assertEqual(order, ["app.models", "app.views", "app.urls", "web.main"])
+
+    def test_deep_module_imported_by_shallow_one(self):
+        """
+        Test that import order wins over the dot-count heuristic.
+        """
+        self.add_imports("a", "x.y.z")
+
+        self.assertEqual(self.graph.get_modules_to_reload("x.y.z"), ["x.y.z", "a"])
+
+    def test_tie_break(self):
+        """
+        Test that independent modules are ordered shallower first, then by name.
+        """
+        self.add_imports("pkg.b", "core")
+        self.add_imports("pkg.a", "core")
+        self.add_imports("z", "core")
+        self.add_imports("pkg.sub.c", "core")
+
+        order = self.graph.get_modules_to_reload("core")
+        self.assertEqual(order, ["core", "z", "pkg.a", "pkg.b", "pkg.sub.c"])
+
+    def test_unaffected_modules_excluded(self):
+        """
+        Test that only the changed module and its (transitive) dependents are returned.
+        """
+        self.add_imports("a", "core")
+        self.add_imports("b", "other")
+
+        self.assertEqual(self.graph.get_modules_to_reload("core"), ["core", "a"])
+        self.assertEqual(self.graph.get_modules_to_reload("leaf"), ["leaf"])
+
+    def test_cycles(self):
+        """
+        Test that modules in an import cycle are still all returned exactly once.
+        """
+        self.add_imports("a", "core")
+        self.add_imports("b", "a")
+        self.add_imports("a", "b")
+        self.add_imports("core", "core")
+
+        order = self.graph.get_modules_to_reload("core")
+        self.assertEqual(order[0], "core")
+        self.assertEqual(sorted(order), ["a", "b", "core"])
+
+
+if __name__ == "__main__":
+    unittest.main()
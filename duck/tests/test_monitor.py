@@ -0,0 +1,99 @@
+"""
+Test cases for the rolling metric history used by the `duck monitor` command.
+"""
+
+import random
+import unittest
+
+from unittest import mock
+
+from duck.cli.commands.monitor import MetricHistory, MonitorCommand
+
+
+class TestMetricHistory(unittest.TestCase):
+    """
+    Test class for the incremental min/max/avg of MetricHistory.
+    """
+
+    def test_stats_match_window(self):
+        """
+        Test that min, max and avg always match a full reduction over the current window.
+        """
+        rng = random.Random(0)
+        history = MetricHistory(5)
+        window = []
+
+        for _ in range(500):
+            value = rng.choice([0, 0.5, 1, 2.5, 7, 7, 3])
+            history.append(value)
+            window = (window + [value])[-5:]
+
+            self.assertEqual(list(history.values), window)
+            self.assertEqual(history.min, min(window))
+            self.assertEqual(history.max, max(window))
+            self.assertAlmostEqual(history.avg, sum(window) / len(window))
+            self.assertEqual(history.current, value)
+
+    def test_non_numeric_samples(self):
+        """
+        Test that non-numeric samples are kept for display but count as 0.0 in the stats.
+        """
+        history = MetricHistory(3)
+
+        for value in (4.0, "N/A", 2.0):
+            history.append(value)
+
+        self.assertEqual(list(history.values), [4.0, "N/A", 2.0])
+        self.assertEqual(history.min, 0.0)
+        self.assertEqual(history.max, 4.0)
+        self.assertAlmostEqual(history.avg, 2.0)
+
+    def test_maxlen(self):
+        """
+        Test that the window never grows beyond maxlen, which is at least 1.
+        """
+        history = MetricHistory(0)
+        history.append(1)
+        history.append(2)
+        self.assertEqual(len(history), 1)
+        self.assertEqual(history.max, 2)
+
+
+class TestHistoryTableScaling(unittest.TestCase):
+    """
+    Test class for the max value used to scale the network sparklines.
+    """
+
+    def get_net_scale(self, values) -> float:
+        history = {}
+
+        for key in ("cpu", "ram", "disk", "net_up"):
+            history[key] = MetricHistory(len(values))
+            for value in values:
+                history[key].append(value)
+
+        with mock.patch.object(MonitorCommand, "sparkline_from_values", return_value="") as sparkline:
+            MonitorCommand.make_history_table(history, cpu_warning=80.0, ram_warning=80.0)
+
+        # Rows are cpu, ram, disk, net_up (net_down has no samples so no sparkline)
+        return sparkline.call_args_list[3].kwargs["max_value"]
+
+    def test_net_scale_matches_per_sample_floor(self):
+        """
+        Test that zero samples count as 1.0 when scaling, i.e. max((v or 1.0) for v in window).
+        """
+        cases = [
+            [0, 0, 0],
+            [0, 0.2, 0.5],
+            [0.2, 0.5],
+            [0, 3.0],
+            [2.0, 3.0],
+        ]
+
+        for values in cases:
+            with self.subTest(values=values):
+                self.assertEqual(self.get_net_scale(values), max((v or 1.0) for v in values))
+
+
+if __name__ == "__main__":
+    unittest.main()
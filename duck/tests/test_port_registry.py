@@ -0,0 +1,69 @@
+"""
+Test cases for the PortRegistry used to track occupied ports.
+"""
+
+import unittest
+
+from duck.exceptions.all import PortError
+from duck.utils.port_registry import PortRegistry
+
+
+class TestPortRegistry(unittest.TestCase):
+    """
+    Test class for registering single and multiple ports.
+    """
+
+    def setUp(self):
+        # Keep the global registry untouched by these tests.
+        self._saved_ports = dict(PortRegistry._occupied_ports)
+        PortRegistry._occupied_ports.clear()
+
+    def tearDown(self):
+        PortRegistry._occupied_ports.clear()
+        PortRegistry._occupied_ports.update(self._saved_ports)
+
+    def test_register_ports(self):
+        """
+        Test that every port in the batch is registered with its occupier.
+        """
+        PortRegistry.register_ports([(8000, "app"), (8001, "django")])
+        self.assertEqual(PortRegistry.get_port_occupier(8000), "app")
+        self.assertEqual(PortRegistry.get_port_occupier(8001), "django")
+
+    def test_register_ports_conflict_registers_none(self):
+        """
+        Test that no port in the batch is registered if one is already occupied.
+        """
+        PortRegistry.register_port(8001, "existing")
+
+        with self.assertRaises(PortError):
+            PortRegistry.register_ports([(8000, "app"), (8001, "django"), (8002, "redirect")])
+
+        self.assertFalse(PortRegistry.is_port_occupied(8000))
+        self.assertFalse(PortRegistry.is_port_occupied(8002))
+        self.assertEqual(PortRegistry.get_port_occupier(8001), "existing")
+
+    def test_register_ports_repeated_in_batch(self):
+        """
+        Test that a port repeated within the same batch is rejected and nothing is registered.
+        """
+        with self.assertRaises(PortError):
+            PortRegistry.register_ports([(8000, "app"), (8000, "django")])
+
+        self.assertFalse(PortRegistry.is_port_occupied(8000))
+
+    def test_register_port_conflict(self):
+        """
+        Test that registering an occupied port raises PortError.
+        """
+        PortRegistry.register_port(8000, "app")
+
+        with self.assertRaises(PortError):
+            PortRegistry.register_port(8000, "other")
+
+        PortRegistry.unregister_port(8000)
+        self.assertFalse(PortRegistry.is_port_occupied(8000))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,13 +4,53 @@ of strings.
 
 These helpers are useful when processing terminal output, log messages,
 or any text containing ANSI color and formatting sequences.
+
+If the optional ``google-re2`` package is installed, its linear-time DFA engine
+is used for matching, otherwise the standard library ``re`` module is used.
 """
 import re
 
 from typing import Iterable, Union
 
+try:
+    import re2
+    
+    # Other distributions (e.g. pyre2, fb-re2) also provide a `re2` module with a
+    # different API and semantics, only google-re2 has `Options`.
+    if not hasattr(re2, "Options"):
+        re2 = None
+except ImportError:
+    re2 = None
+
+
+# Every ANSI escape sequence starts with the ESC character
+ANSI_ESCAPE_CHAR = "\x1b"
+ANSI_ESCAPE_BYTE = b"\x1b"
+
+
+def _compile(pattern: Union[str, bytes]):
+    """
+    Compile the pattern with google-re2 if available, falling back to `re` if
+    re2 can't compile it or strips a sample differently than `re` would.
+    """
+    if re2 is not None:
+        sample = "a\x1b[1;31mb\x1b[0m\x1b]c"
+        sample = sample.encode() if isinstance(pattern, bytes) else sample
+        empty = sample[:0]
+        
+        try:
+            compiled = re2.compile(pattern)
+            if compiled.sub(empty, sample) == re.sub(pattern, empty, sample):
+                return compiled
+        except Exception:
+            pass
+    return re.compile(pattern)
+
+
+ANSI_REMOVAL_PATTERN = _compile(r"\x1B[@-_][0-?]*[ -/]*[@-~]")
 
-ANSI_REMOVAL_PATTERN = re.compile(r"\x1B[@-_][0-?]*[ -/]*[@-~]")
+# Same pattern for raw bytes (e.g. subprocess output or log files), avoids decoding first
+ANSI_BYTES_REMOVAL_PATTERN = _compile(rb"\x1B[@-_][0-?]*[ -/]*[@-~]")
 
 
 def remove_ansi_escape_codes(lines: Union[list[str], tuple[str, ...], set[str]]) -> list[str]:
@@ -33,7 +73,7 @@ def remove_ansi_escape_codes(lines: Union[list[str], tuple[str, ...], set[str]])
             f"lines must be a list, tuple, or set, not {type(lines).__name__!r}."
         )
 
-    cleaned_lines: list[str] = []
+    lines = list(lines)
 
     for line in lines:
         if not isinstance(line, str):
@@ -41,9 +81,23 @@ def remove_ansi_escape_codes(lines: Union[list[str], tuple[str, ...], set[str]])
                 f"all items in lines must be strings, got {type(line).__name__!r}."
             )
 
-        cleaned_lines.append(remove_ansi_escape_codes_str(line))
+    if not lines:
+        return []
 
-    return cleaned_lines
+    # Strip all lines with a single regex pass over the joined text. Escape
+    # sequences never contain a newline, so no match can span two lines.
+    joined = "\n".join(lines)
+
+    if ANSI_ESCAPE_CHAR not in joined:
+        # Nothing to strip, skip the regex engine entirely.
+        return lines
+
+    if joined.count("\n") != len(lines) - 1:
+        # Some lines contain newlines themselves, splitting would not map back
+        # to the original lines. Bind `sub` once rather than looking it up per line.
+        sub = ANSI_REMOVAL_PATTERN.sub
+        return [sub("", line) for line in lines]
+    return ANSI_REMOVAL_PATTERN.sub("", joined).split("\n")
 
 
 def remove_ansi_escape_codes_str(string: str) -> str:
@@ -61,4 +115,30 @@ def remove_ansi_escape_codes_str(string: str) -> str:
     """
     if not isinstance(string, str):
         raise TypeError(f"string must be a string, not {type(string).__name__!r}.")
+
+    if ANSI_ESCAPE_CHAR not in string:
+        # Plain text, no escape sequences to strip.
+        return string
     return ANSI_REMOVAL_PATTERN.sub("", string)
+
+
+def remove_ansi_escape_codes_bytes(data: bytes) -> bytes:
+    """
+    Remove ANSI escape codes from raw bytes.
+
+    Args:
+        data: Bytes with optional ANSI escape codes.
+
+    Returns:
+        The bytes with ANSI escape codes removed.
+
+    Raises:
+        TypeError: If ``data`` is not bytes-like.
+    """
+    if not isinstance(data, (bytes, bytearray)):
+        raise TypeError(f"data must be bytes, not {type(data).__name__!r}.")
+
+    if ANSI_ESCAPE_BYTE not in data:
+        # Plain data, no escape sequences to strip.
+        return bytes(data)
+    return ANSI_BYTES_REMOVAL_PATTERN.sub(b"", data)
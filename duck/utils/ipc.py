@@ -5,6 +5,7 @@ It allows processes to communicate by writing to and reading from a shared file.
 Functions:
 - `get_writer()` -> `FileWriter`: Returns a FileWriter object for writing messages.
 - `get_reader()` -> `FileReader`: Returns a FileReader object for reading messages.
+- `watch_file()` -> `Observer`: Notifies a callback whenever the shared file is modified.
     
 Example Usage:
 
@@ -24,6 +25,11 @@ with get_reader() as reader:
 
 import os
 
+from typing import Callable
+
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
 
 class FileWriter:
     """
@@ -99,6 +105,52 @@ class FileReader:
             self.file.close()
 
 
+class FileModifiedHandler(FileSystemEventHandler):
+    """
+    Filesystem event handler calling a callback whenever a specific file is modified.
+    """
+
+    def __init__(self, filepath: str, callback: Callable[[], None]):
+        super().__init__()
+        self.filepath = os.path.abspath(filepath)
+        self.callback = callback
+
+    def on_any_event(self, event):
+        """
+        Called on any filesystem event in the watched directory.
+        """
+        if event.is_directory:
+            return
+
+        if os.path.abspath(event.src_path) == self.filepath:
+            self.callback()
+
+
+def watch_file(filepath: str, callback: Callable[[], None]) -> Observer:
+    """
+    Watch the shared file and call `callback` whenever it is modified.
+
+    This uses native filesystem notifications (e.g. inotify on Linux) so that readers can
+    block until a message is written instead of polling the file.
+
+    Args:
+        filepath (str): The path to the shared file.
+        callback (Callable[[], None]): Callable to call on every modification. It is called
+            from the observer thread.
+
+    Returns:
+        Observer: The started observer, call `stop()` on it to stop watching.
+    """
+    observer = Observer()
+    observer.schedule(
+        FileModifiedHandler(filepath, callback),
+        os.path.dirname(os.path.abspath(filepath)),
+        recursive=False,
+    )
+    observer.start()
+    return observer
+
+
 def get_writer(filepath: str = ".ipc") -> FileWriter:
     """
     Get a FileWriter object for writing messages.
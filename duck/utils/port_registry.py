@@ -2,6 +2,8 @@
 Utilities for tracking and validating occupied ports within Duck.
 """
 
+from typing import Iterable, Tuple
+
 from duck.exceptions.all import PortError
 
 
@@ -39,6 +41,37 @@ class PortRegistry:
 
         cls._occupied_ports[port] = occupier
 
+    @classmethod
+    def register_ports(cls, ports: Iterable[Tuple[int, str]]) -> None:
+        """
+        Register multiple ports as occupied in one call.
+
+        All ports are validated before any is registered, so either every
+        port is registered or none is.
+
+        Args:
+            ports: Iterable of `(port, occupier)` pairs.
+
+        Raises:
+            PortError: If any port is already registered or repeated in `ports`.
+        """
+        new_ports: dict[int, str] = {}
+
+        for port, occupier in ports:
+            existing_occupier = cls._occupied_ports.get(port) or new_ports.get(port)
+
+            if existing_occupier:
+                raise PortError(
+                    (
+                        f'Port "{port}" is already occupied by '
+                        f'"{existing_occupier}".'
+                    )
+                )
+
+            new_ports[port] = occupier
+
+        cls._occupied_ports.update(new_ports)
+
     # Queries
 
     @classmethod
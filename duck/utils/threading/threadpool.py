@@ -371,14 +371,17 @@ class ThreadPoolManager:
             if task_type != self._task_type:
                 raise UnknownTaskError(task_type, self._task_type)
         
+        if not log_exception:
+            # Nothing to add at the task boundary, submit the task as is.
+            return pool.submit(task)
+            
         def wrapped_task():
             try:
                 return task()
             except Exception as e:
-                # Log exception already if 
-                if log_exception:
-                    logger.log(f"Error executing threadpool task '{task}': {e}", level=logger.WARNING)
-                    logger.log_exception(e)
+                # Log exception already
+                logger.log(f"Error executing threadpool task '{task}': {e}", level=logger.WARNING)
+                logger.log_exception(e)
                 raise e # Re-raise exception
         
         # Submit wrapped task instead.
@@ -400,15 +403,16 @@ class ThreadPoolManager:
         else:
             raise RuntimeError("Threadpool is not running. Call start() first.")
             
-    def stop(self, wait: bool = True):
+    def stop(self, wait: bool = True, cancel_futures: bool = False):
         """
         Shutdowns the threadpool.
 
         Args:
             wait (bool): Whether to wait for running tasks to finish.
+            cancel_futures (bool): Whether to cancel all pending (not yet running) tasks.
         """
         if self._pool is not None:
-            self._pool.shutdown(wait=wait)
+            self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
             self._pool = None
     
     def _worker_init(self):
@@ -2,12 +2,16 @@
 Version information for the Duck package.
 """
 
+import re
 import sys
 
+from duck import __version__ as version
 
-# Package version
-version_info = (2, 2, 0)
-version = ".".join(map(str, version_info))
+
+# Package version, only the leading numeric release part is used so
+# pre-release/local versions like "2.3.0rc1" or "2.3.0.dev0" give (2, 3, 0).
+_release = re.match(r"\d+(?:\.\d+)*", version)
+version_info = tuple(map(int, _release.group().split("."))) if _release else ()
 
 # Server identification string
 python_version = ".".join(map(str, sys.version_info[:3]))